@@ -6,6 +6,7 @@ YAML 프론트매터 파싱을 통해 Anthropic Agent Skills 패턴을 구현합
 from __future__ import annotations
 
 import logging
+import os
 import re
 from pathlib import Path
 from typing import NotRequired, TypedDict
@@ -61,10 +62,19 @@ def _validate_skill_name(name: str, directory_name: str) -> tuple[bool, str]:
     return True, ""
 
 
-def _parse_skill_metadata(skill_md_path: Path, source: str) -> SkillMetadata | None:
-    """SKILL.md 파일에서 YAML 프론트매터를 파싱합니다."""
+def _parse_skill_metadata(
+    skill_md_path: Path,
+    source: str,
+    stat_result: os.stat_result | None = None,
+) -> SkillMetadata | None:
+    """SKILL.md 파일에서 YAML 프론트매터를 파싱합니다.
+
+    호출자가 이미 얻은 stat 결과가 있으면 크기 확인에 재사용합니다.
+    """
     try:
-        file_size = skill_md_path.stat().st_size
+        if stat_result is None:
+            stat_result = skill_md_path.stat()
+        file_size = stat_result.st_size
         if file_size > MAX_SKILL_FILE_SIZE:
             logger.warning(
                 "%s 건너뜀: 파일이 너무 큼 (%d 바이트)", skill_md_path, file_size
@@ -142,8 +152,6 @@ def _parse_skill_metadata(skill_md_path: Path, source: str) -> SkillMetadata | N
 def _list_skills_from_dir(skills_dir: Path, source: str) -> list[SkillMetadata]:
     """단일 스킬 디렉토리에서 모든 스킬을 나열합니다."""
     skills_dir = skills_dir.expanduser()
-    if not skills_dir.exists():
-        return []
 
     try:
         resolved_base = skills_dir.resolve()
@@ -152,23 +160,39 @@ def _list_skills_from_dir(skills_dir: Path, source: str) -> list[SkillMetadata]:
 
     skills: list[SkillMetadata] = []
 
-    for skill_dir in skills_dir.iterdir():
-        if not _is_safe_path(skill_dir, resolved_base):
-            continue
-
-        if not skill_dir.is_dir():
-            continue
-
-        skill_md_path = skill_dir / "SKILL.md"
-        if not skill_md_path.exists():
-            continue
-
-        if not _is_safe_path(skill_md_path, resolved_base):
-            continue
-
-        metadata = _parse_skill_metadata(skill_md_path, source=source)
-        if metadata:
-            skills.append(metadata)
+    # DirEntry가 readdir의 타입 정보를 캐시하므로 항목마다 stat을 반복하지 않음
+    try:
+        with os.scandir(skills_dir) as entries:
+            for entry in entries:
+                skill_dir = Path(entry.path)
+
+                # 일반 항목은 구성상 skills_dir 내부이므로 심볼릭 링크만 해석해 검증
+                if entry.is_symlink() and not _is_safe_path(skill_dir, resolved_base):
+                    continue
+
+                if not entry.is_dir():
+                    continue
+
+                # stat 한 번으로 존재 여부 확인과 크기 검사용 정보를 함께 얻음
+                skill_md_path = skill_dir / "SKILL.md"
+                try:
+                    skill_md_stat = os.stat(skill_md_path)
+                except OSError:
+                    continue
+
+                if skill_md_path.is_symlink() and not _is_safe_path(
+                    skill_md_path, resolved_base
+                ):
+                    continue
+
+                metadata = _parse_skill_metadata(
+                    skill_md_path, source=source, stat_result=skill_md_stat
+                )
+                if metadata:
+                    skills.append(metadata)
+    except OSError:
+        # 디렉토리가 없거나 읽을 수 없음
+        return []
 
     return skills
 
@@ -32,12 +32,12 @@ from deepagents_cli.widgets.messages import (
     ToolCallMessage,
     UserMessage,
 )
-from deepagents_cli.widgets.status import StatusBar
+from deepagents_cli.widgets.status import StatusBar, format_token_count
 from deepagents_cli.widgets.welcome import WelcomeBanner
 
 logger = logging.getLogger(__name__)
 
-TOKENS_K_THRESHOLD = 1000
+_QUIT_COMMANDS = frozenset({"/quit", "/exit", "/q"})
 
 if TYPE_CHECKING:
     from langgraph.pregel import Pregel
@@ -390,7 +390,7 @@ class DeepAgentsApp(App):
         """
         cmd = command.lower().strip()
 
-        if cmd in {"/quit", "/exit", "/q"}:
+        if cmd in _QUIT_COMMANDS:
             self.exit()
             return
 
@@ -421,12 +421,7 @@ class DeepAgentsApp(App):
 
         if cmd == "/tokens":
             if self._token_tracker and self._token_tracker.current_context > 0:
-                count = self._token_tracker.current_context
-                formatted = (
-                    f"{count / TOKENS_K_THRESHOLD:.1f}K"
-                    if count >= TOKENS_K_THRESHOLD
-                    else str(count)
-                )
+                formatted = format_token_count(self._token_tracker.current_context)
                 await self._mount_message(SystemMessage(f"Current context: {formatted} tokens"))
             else:
                 await self._mount_message(SystemMessage("No token usage yet"))
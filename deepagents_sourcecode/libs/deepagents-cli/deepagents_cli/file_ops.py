@@ -6,6 +6,7 @@ Helpers for tracking file operations and computing diffs for CLI display.
 from __future__ import annotations
 
 import difflib
+import itertools
 import logging
 from dataclasses import dataclass, field
 from pathlib import Path
@@ -72,16 +73,19 @@ def compute_unified_diff(
     """
     before_lines = before.splitlines()
     after_lines = after.splitlines()
-    diff_lines = list(
-        difflib.unified_diff(
-            before_lines,
-            after_lines,
-            fromfile=f"{display_path} (before)",
-            tofile=f"{display_path} (after)",
-            lineterm="",
-            n=context_lines,
-        )
+    diff_iter = difflib.unified_diff(
+        before_lines,
+        after_lines,
+        fromfile=f"{display_path} (before)",
+        tofile=f"{display_path} (after)",
+        lineterm="",
+        n=context_lines,
     )
+    # One line past the limit is enough to know the diff must be truncated;
+    # difflib produces lines lazily, so the rest is never computed
+    if max_lines is not None and max_lines > 0:
+        diff_iter = itertools.islice(diff_iter, max_lines + 1)
+    diff_lines = list(diff_iter)
     if not diff_lines:
         return None
     if max_lines is not None and len(diff_lines) > max_lines:
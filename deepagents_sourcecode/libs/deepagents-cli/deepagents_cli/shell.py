@@ -7,12 +7,13 @@ from __future__ import annotations
 
 import os
 import subprocess
-from typing import Any
+from typing import Any, ClassVar
 
 from langchain.agents.middleware.types import AgentMiddleware, AgentState
-from langchain.tools import ToolRuntime, tool
+from langchain.tools import ToolRuntime  # noqa: TC002 - create_schema_from_function resolves it at runtime
 from langchain_core.messages import ToolMessage
-from langchain_core.tools.base import ToolException
+from langchain_core.tools import StructuredTool
+from langchain_core.tools.base import ArgsSchema, ToolException, create_schema_from_function
 
 
 class ShellMiddleware(AgentMiddleware[AgentState, Any]):
@@ -22,6 +23,8 @@ class ShellMiddleware(AgentMiddleware[AgentState, Any]):
     for the human in the loop safeguard provided by the CLI itself.
     """
 
+    _args_schema: ClassVar[ArgsSchema | None] = None
+
     def __init__(
         self,
         *,
@@ -56,21 +59,39 @@ class ShellMiddleware(AgentMiddleware[AgentState, Any]):
             f"be truncated if they exceed the configured timeout or output limits."
         )
 
-        @tool(self._tool_name, description=description)
-        def shell_tool(
-            command: str,
-            runtime: ToolRuntime[None, AgentState],
-        ) -> ToolMessage | str:
-            """Execute a shell command.
+        self._shell_tool = StructuredTool.from_function(
+            func=self._shell_tool_impl,
+            name=self._tool_name,
+            description=description,
+            args_schema=self._get_args_schema(),
+        )
+        self.tools = [self._shell_tool]
+
+    @classmethod
+    def _get_args_schema(cls) -> ArgsSchema:
+        """Return the shell tool's args schema, building it on first use.
 
-            Args:
-                command: The shell command to execute.
-                runtime: The tool runtime context.
-            """
-            return self._run_shell_command(command, tool_call_id=runtime.tool_call_id)
+        Schema inference inspects the signature and builds a pydantic model, so
+        it is done once per class rather than once per middleware instance.
+        """
+        if cls._args_schema is None:
+            cls._args_schema = create_schema_from_function(
+                "shell", cls._shell_tool_impl, filter_args=["self"]
+            )
+        return cls._args_schema
 
-        self._shell_tool = shell_tool
-        self.tools = [self._shell_tool]
+    def _shell_tool_impl(
+        self,
+        command: str,
+        runtime: ToolRuntime[None, AgentState],
+    ) -> ToolMessage | str:
+        """Execute a shell command.
+
+        Args:
+            command: The shell command to execute.
+            runtime: The tool runtime context.
+        """
+        return self._run_shell_command(command, tool_call_id=runtime.tool_call_id)
 
     def _run_shell_command(
         self,
@@ -103,6 +124,19 @@ class ShellMiddleware(AgentMiddleware[AgentState, Any]):
                 cwd=self._workspace_root,
             )
 
+            # Fast path: clean success with nothing on stderr
+            if result.returncode == 0 and not result.stderr:
+                output = result.stdout or "<no output>"
+                if len(output) > self._max_output_bytes:
+                    output = output[: self._max_output_bytes]
+                    output += f"\n\n... Output truncated at {self._max_output_bytes} bytes."
+                return ToolMessage(
+                    content=output,
+                    tool_call_id=tool_call_id,
+                    name=self._tool_name,
+                    status="success",
+                )
+
             # Combine stdout and stderr
             output_parts = []
             if result.stdout:
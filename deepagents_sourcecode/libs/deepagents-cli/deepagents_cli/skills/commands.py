@@ -7,14 +7,117 @@ These commands are registered with the CLI via cli.py:
 """
 
 import argparse
+import functools
+import os
 import re
 from pathlib import Path
 
 from deepagents_cli.config import COLORS, Settings, console
-from deepagents_cli.skills.load import list_skills
+from deepagents_cli.skills.load import (
+    ExtendedSkillMetadata,
+    invalidate_skills_cache,
+    list_skills,
+)
 
 MAX_SKILL_NAME_LENGTH = 64
 
+# Characters allowed in a skill name: lowercase alphanumeric and hyphens
+_SKILL_NAME_CHARS = frozenset("abcdefghijklmnopqrstuvwxyz0123456789-")
+_PATH_SEPARATORS = frozenset("/\\")
+
+# Agent identifiers are looser than skill names: mixed case and underscores allowed
+_AGENT_RE = re.compile(r"^[A-Za-z0-9_-]{1,64}\Z")
+
+# Template for new SKILL.md files; filled with the skill name and its title-cased form
+_SKILL_TEMPLATE = """---
+name: {name}
+description: Brief description of what this skill does and when to use it.
+# Optional fields per Agent Skills spec:
+# license: Apache-2.0
+# compatibility: Designed for deepagents CLI
+# metadata:
+#   author: your-org
+#   version: "1.0"
+# allowed-tools: Bash(git:*) Read
+---
+
+# {title} Skill
+
+## Description
+
+[Provide a detailed explanation of what this skill does and when it should be used]
+
+## When to Use
+
+- [Scenario 1: When the user asks...]
+- [Scenario 2: When you need to...]
+- [Scenario 3: When the task involves...]
+
+## How to Use
+
+### Step 1: [First Action]
+[Explain what to do first]
+
+### Step 2: [Second Action]
+[Explain what to do next]
+
+### Step 3: [Final Action]
+[Explain how to complete the task]
+
+## Best Practices
+
+- [Best practice 1]
+- [Best practice 2]
+- [Best practice 3]
+
+## Supporting Files
+
+This skill directory can include supporting files referenced in the instructions:
+- `helper.py` - Python scripts for automation
+- `config.json` - Configuration files
+- `reference.md` - Additional reference documentation
+
+## Examples
+
+### Example 1: [Scenario Name]
+
+**User Request:** "[Example user request]"
+
+**Approach:**
+1. [Step-by-step breakdown]
+2. [Using tools and commands]
+3. [Expected outcome]
+
+### Example 2: [Another Scenario]
+
+**User Request:** "[Another example]"
+
+**Approach:**
+1. [Different approach]
+2. [Relevant commands]
+3. [Expected result]
+
+## Notes
+
+- [Additional tips, warnings, or context]
+- [Known limitations or edge cases]
+- [Links to external resources if helpful]
+"""
+
+
+def _is_valid_skill_name(name: str) -> bool:
+    """Check that name is lowercase alphanumeric segments joined by single hyphens.
+
+    A character-set scan is cheaper than a regex match for short ASCII names.
+    """
+    return (
+        bool(name)
+        and _SKILL_NAME_CHARS.issuperset(name)
+        and name[0] != "-"
+        and name[-1] != "-"
+        and "--" not in name
+    )
+
 
 def _validate_name(name: str) -> tuple[bool, str]:
     """Validate name per Agent Skills spec.
@@ -40,20 +143,48 @@ def _validate_name(name: str) -> tuple[bool, str]:
     if len(name) > MAX_SKILL_NAME_LENGTH:
         return False, "cannot exceed 64 characters"
 
+    # Spec: lowercase alphanumeric and hyphens only, no start/end hyphen, no
+    # consecutive hyphens. That charset excludes '.', '/' and '\\', so a single
+    # scan accepts valid names; path components only decide the error message.
+    if _is_valid_skill_name(name):
+        return True, ""
+
     # Check for path traversal sequences
-    if ".." in name or "/" in name or "\\" in name:
+    if ".." in name or not _PATH_SEPARATORS.isdisjoint(name):
         return False, "cannot contain path components"
 
-    # Spec: lowercase alphanumeric and hyphens only
-    # Pattern ensures: no start/end hyphen, no consecutive hyphens
-    if not re.match(r"^[a-z0-9]+(-[a-z0-9]+)*$", name):
-        return (
-            False,
-            "must be lowercase letters, numbers, and hyphens only "
-            "(no uppercase, no underscores, cannot start/end with hyphen)",
-        )
+    return (
+        False,
+        "must be lowercase letters, numbers, and hyphens only "
+        "(no uppercase, no underscores, cannot start/end with hyphen)",
+    )
+
+
+def _validate_agent_name(name: str) -> tuple[bool, str]:
+    """Validate an agent identifier used to locate the agent's skills directory.
+
+    Args:
+        name: The agent name to validate
+
+    Returns:
+        Tuple of (is_valid, error_message). If valid, error_message is empty.
+    """
+    if _AGENT_RE.match(name):
+        return True, ""
+    return (
+        False,
+        "must be 1-64 characters of letters, numbers, hyphens, and underscores",
+    )
 
-    return True, ""
+
+@functools.lru_cache(maxsize=1)
+def _settings() -> Settings:
+    """Return the process-wide Settings, detecting the environment only once.
+
+    Environment variable or working directory changes made later in the same
+    process are not picked up; call `_settings.cache_clear()` to re-detect.
+    """
+    return Settings.from_environment()
 
 
 def _validate_skill_path(skill_dir: Path, base_dir: Path) -> tuple[bool, str]:
@@ -73,13 +204,29 @@ def _validate_skill_path(skill_dir: Path, base_dir: Path) -> tuple[bool, str]:
     except (OSError, RuntimeError) as e:
         return False, f"Invalid path: {e}"
 
-    # Check if skill_dir is within base_dir (Python 3.9+)
+    # Check if skill_dir is within base_dir
     if not resolved_skill.is_relative_to(resolved_base):
         return False, f"Skill directory must be within {base_dir}"
 
     return True, ""
 
 
+def _format_skill_entries(skills: list[ExtendedSkillMetadata]) -> str:
+    """Render a group of skills as one Rich markup string for a single console write.
+
+    Each entry is the name, description, and location, followed by a blank line.
+    """
+    primary = COLORS["primary"]
+    dim = COLORS["dim"]
+    lines: list[str] = []
+    for skill in skills:
+        lines.append(f"[{primary}]  • [bold]{skill['name']}[/bold][/{primary}]")
+        lines.append(f"[{dim}]    {skill['description']}[/{dim}]")
+        lines.append(f"[{dim}]    Location: {skill['dir']}/[/{dim}]")
+        lines.append("")
+    return "\n".join(lines)
+
+
 def _list(agent: str, *, project: bool = False) -> None:
     """List all available skills for the specified agent.
 
@@ -88,7 +235,7 @@ def _list(agent: str, *, project: bool = False) -> None:
         project: If True, show only project skills.
             If False, show all skills (user + project).
     """
-    settings = Settings.from_environment()
+    settings = _settings()
     user_skills_dir = settings.get_user_skills_dir(agent)
     project_skills_dir = settings.get_project_skills_dir()
 
@@ -153,24 +300,14 @@ def _list(agent: str, *, project: bool = False) -> None:
     # Show user skills
     if user_skills and not project:
         console.print("[bold cyan]User Skills:[/bold cyan]", style=COLORS["primary"])
-        for skill in user_skills:
-            skill_path = Path(skill["path"])
-            console.print(f"  • [bold]{skill['name']}[/bold]", style=COLORS["primary"])
-            console.print(f"    {skill['description']}", style=COLORS["dim"])
-            console.print(f"    Location: {skill_path.parent}/", style=COLORS["dim"])
-            console.print()
+        console.print(_format_skill_entries(user_skills))
 
     # Show project skills
     if project_skills_list:
         if not project and user_skills:
             console.print()
         console.print("[bold green]Project Skills:[/bold green]", style=COLORS["primary"])
-        for skill in project_skills_list:
-            skill_path = Path(skill["path"])
-            console.print(f"  • [bold]{skill['name']}[/bold]", style=COLORS["primary"])
-            console.print(f"    {skill['description']}", style=COLORS["dim"])
-            console.print(f"    Location: {skill_path.parent}/", style=COLORS["dim"])
-            console.print()
+        console.print(_format_skill_entries(project_skills_list))
 
 
 def _create(skill_name: str, agent: str, *, project: bool = False) -> None:
@@ -194,7 +331,7 @@ def _create(skill_name: str, agent: str, *, project: bool = False) -> None:
         return
 
     # Determine target directory
-    settings = Settings.from_environment()
+    settings = _settings()
     if project:
         if not settings.project_root:
             console.print("[bold red]Error:[/bold red] Not in a project directory.")
@@ -215,93 +352,26 @@ def _create(skill_name: str, agent: str, *, project: bool = False) -> None:
         console.print(f"[bold red]Error:[/bold red] {path_error}")
         return
 
-    if skill_dir.exists():
-        console.print(
-            f"[bold red]Error:[/bold red] Skill '{skill_name}' already exists at {skill_dir}"
-        )
-        return
-
     # Create skill directory
     skill_dir.mkdir(parents=True, exist_ok=True)
 
     # Create template SKILL.md (per Agent Skills spec: https://agentskills.io/specification)
-    template = f"""---
-name: {skill_name}
-description: Brief description of what this skill does and when to use it.
-# Optional fields per Agent Skills spec:
-# license: Apache-2.0
-# compatibility: Designed for deepagents CLI
-# metadata:
-#   author: your-org
-#   version: "1.0"
-# allowed-tools: Bash(git:*) Read
----
-
-# {skill_name.title().replace("-", " ")} Skill
-
-## Description
-
-[Provide a detailed explanation of what this skill does and when it should be used]
-
-## When to Use
-
-- [Scenario 1: When the user asks...]
-- [Scenario 2: When you need to...]
-- [Scenario 3: When the task involves...]
-
-## How to Use
-
-### Step 1: [First Action]
-[Explain what to do first]
-
-### Step 2: [Second Action]
-[Explain what to do next]
-
-### Step 3: [Final Action]
-[Explain how to complete the task]
-
-## Best Practices
-
-- [Best practice 1]
-- [Best practice 2]
-- [Best practice 3]
-
-## Supporting Files
-
-This skill directory can include supporting files referenced in the instructions:
-- `helper.py` - Python scripts for automation
-- `config.json` - Configuration files
-- `reference.md` - Additional reference documentation
-
-## Examples
-
-### Example 1: [Scenario Name]
-
-**User Request:** "[Example user request]"
-
-**Approach:**
-1. [Step-by-step breakdown]
-2. [Using tools and commands]
-3. [Expected outcome]
-
-### Example 2: [Another Scenario]
-
-**User Request:** "[Another example]"
-
-**Approach:**
-1. [Different approach]
-2. [Relevant commands]
-3. [Expected result]
-
-## Notes
-
-- [Additional tips, warnings, or context]
-- [Known limitations or edge cases]
-- [Links to external resources if helpful]
-"""
+    template = _SKILL_TEMPLATE.format(name=skill_name, title=skill_name.title().replace("-", " "))
 
+    # O_EXCL makes the existence check and the create a single atomic step
     skill_md = skill_dir / "SKILL.md"
-    skill_md.write_text(template)
+    try:
+        fd = os.open(skill_md, os.O_WRONLY | os.O_CREAT | os.O_EXCL, 0o644)
+    except FileExistsError:
+        console.print(
+            f"[bold red]Error:[/bold red] Skill '{skill_name}' already exists at {skill_dir}"
+        )
+        return
+    try:
+        os.write(fd, template.encode("utf-8"))
+    finally:
+        os.close(fd)
+    invalidate_skills_cache()
 
     console.print(f"✓ Skill '{skill_name}' created successfully!", style=COLORS["primary"])
     console.print(f"Location: {skill_dir}\n", style=COLORS["dim"])
@@ -331,7 +401,7 @@ def _info(skill_name: str, *, agent: str = "agent", project: bool = False) -> No
         project: If True, only search in project skills.
             If False, search in both user and project skills.
     """
-    settings = Settings.from_environment()
+    settings = _settings()
     user_skills_dir = settings.get_user_skills_dir(agent)
     project_skills_dir = settings.get_project_skills_dir()
 
@@ -344,14 +414,15 @@ def _info(skill_name: str, *, agent: str = "agent", project: bool = False) -> No
     else:
         skills = list_skills(user_skills_dir=user_skills_dir, project_skills_dir=project_skills_dir)
 
-    # Find the skill
-    skill = next((s for s in skills if s["name"] == skill_name), None)
+    # Find the skill (list_skills merges by name, so each name appears once)
+    by_name = {s["name"]: s for s in skills}
+    skill = by_name.get(skill_name)
 
     if not skill:
         console.print(f"[bold red]Error:[/bold red] Skill '{skill_name}' not found.")
         console.print("\n[dim]Available skills:[/dim]", style=COLORS["dim"])
-        for s in skills:
-            console.print(f"  - {s['name']}", style=COLORS["dim"])
+        for name in by_name:
+            console.print(f"  - {name}", style=COLORS["dim"])
         return
 
     # Read the full SKILL.md file
@@ -370,10 +441,10 @@ def _info(skill_name: str, *, agent: str = "agent", project: bool = False) -> No
         style=COLORS["primary"],
     )
     console.print(f"[bold]Description:[/bold] {skill['description']}\n", style=COLORS["dim"])
-    console.print(f"[bold]Location:[/bold] {skill_path.parent}/\n", style=COLORS["dim"])
+    console.print(f"[bold]Location:[/bold] {skill['dir']}/\n", style=COLORS["dim"])
 
     # List supporting files
-    skill_dir = skill_path.parent
+    skill_dir = Path(skill["dir"])
     supporting_files = [f for f in skill_dir.iterdir() if f.name != "SKILL.md"]
 
     if supporting_files:
@@ -462,7 +533,7 @@ def execute_skills_command(args: argparse.Namespace) -> None:
     """
     # validate agent argument
     if args.agent:
-        is_valid, error_msg = _validate_name(args.agent)
+        is_valid, error_msg = _validate_agent_name(args.agent)
         if not is_valid:
             console.print(f"[bold red]Error:[/bold red] Invalid agent name: {error_msg}")
             console.print(
@@ -9,24 +9,75 @@ For middleware usage within agents, use deepagents.middleware.skills.SkillsMiddl
 
 from __future__ import annotations
 
-from typing import TYPE_CHECKING
+from pathlib import Path
 
 from deepagents.backends.filesystem import FilesystemBackend
 from deepagents.middleware.skills import SkillMetadata
 from deepagents.middleware.skills import _list_skills as list_skills_from_backend
 
-if TYPE_CHECKING:
-    from pathlib import Path
-
 
 class ExtendedSkillMetadata(SkillMetadata):
     """Extended skill metadata for CLI display, adds source tracking."""
 
     source: str
+    """Where the skill was loaded from ('user' or 'project')."""
+
+    dir: str
+    """Directory containing the skill's SKILL.md, precomputed for display."""
+
 
+# Parsed skills per directory, keyed by (resolved directory, directory mtime in ns).
+# Adding or removing a skill directory bumps the mtime; edits inside an existing
+# SKILL.md do not, so callers that write skill files should call
+# invalidate_skills_cache().
+_LIST_CACHE: dict[tuple[str, int], list[SkillMetadata]] = {}
 
 # Re-export for CLI commands
-__all__ = ["SkillMetadata", "list_skills"]
+__all__ = ["SkillMetadata", "invalidate_skills_cache", "list_skills"]
+
+
+def invalidate_skills_cache() -> None:
+    """Drop all cached skill listings so the next list_skills() call rescans."""
+    _LIST_CACHE.clear()
+
+
+def _list_skills_cached(skills_dir: Path) -> list[SkillMetadata]:
+    """Load skills from a single directory, reusing the last scan if it is unchanged.
+
+    Args:
+        skills_dir: Path to the skills directory.
+
+    Returns:
+        Skill metadata parsed from the directory, or an empty list if it does not exist.
+    """
+    try:
+        resolved = skills_dir.resolve()
+        key = (str(resolved), resolved.stat().st_mtime_ns)
+    except (OSError, RuntimeError):
+        return []
+
+    cached = _LIST_CACHE.get(key)
+    if cached is None:
+        backend = FilesystemBackend(root_dir=str(skills_dir))
+        cached = list_skills_from_backend(backend=backend, source_path=".")
+        _LIST_CACHE[key] = cached
+    return list(cached)
+
+
+def _extend_skills(skills_dir: Path, source: str) -> list[ExtendedSkillMetadata]:
+    """Load a directory's skills and add the CLI display fields.
+
+    Args:
+        skills_dir: Path to the skills directory.
+        source: Source label for the skills ('user' or 'project').
+
+    Returns:
+        Skill metadata with `source` and `dir` set.
+    """
+    return [
+        {**skill, "source": source, "dir": str(Path(skill["path"]).parent)}
+        for skill in _list_skills_cached(skills_dir)
+    ]
 
 
 def list_skills(
@@ -38,34 +89,24 @@ def list_skills(
     functionality. It uses FilesystemBackend to load skills from local directories.
 
     When both directories are provided, project skills with the same name as
-    user skills will override them (project skills take precedence).
+    user skills will override them (project skills take precedence). Within a
+    single directory, the last skill found with a given name wins.
+
+    Results are cached per directory and reused while the directory's mtime is
+    unchanged; see invalidate_skills_cache().
 
     Args:
         user_skills_dir: Path to the user-level skills directory.
         project_skills_dir: Path to the project-level skills directory.
 
     Returns:
-        Merged list of skill metadata from both sources, with project skills
-        taking precedence over user skills when names conflict.
+        Merged list of skill metadata from both sources, keyed by name, with
+        project skills taking precedence over user skills when names conflict.
     """
-    all_skills: dict[str, ExtendedSkillMetadata] = {}
-
-    # Load user skills first (foundation)
-    if user_skills_dir and user_skills_dir.exists():
-        user_backend = FilesystemBackend(root_dir=str(user_skills_dir))
-        user_skills = list_skills_from_backend(backend=user_backend, source_path=".")
-        for skill in user_skills:
-            # Add source field for CLI display
-            extended_skill: ExtendedSkillMetadata = {**skill, "source": "user"}
-            all_skills[skill["name"]] = extended_skill
-
-    # Load project skills second (override/augment)
-    if project_skills_dir and project_skills_dir.exists():
-        project_backend = FilesystemBackend(root_dir=str(project_skills_dir))
-        project_skills = list_skills_from_backend(backend=project_backend, source_path=".")
-        for skill in project_skills:
-            # Add source field for CLI display
-            extended_skill: ExtendedSkillMetadata = {**skill, "source": "project"}
-            all_skills[skill["name"]] = extended_skill
-
-    return list(all_skills.values())
+    # Add source and dir fields for CLI display
+    user_skills = _extend_skills(user_skills_dir, "user") if user_skills_dir else []
+    project_skills = _extend_skills(project_skills_dir, "project") if project_skills_dir else []
+    # Merge by name: later entries win (project over user, and the last duplicate
+    # within a single directory)
+    merged = {skill["name"]: skill for skill in (*user_skills, *project_skills)}
+    return list(merged.values())
@@ -3,12 +3,24 @@
 UI rendering and display utilities for the CLI.
 """
 
+import functools
 import json
+import os
+import time
+from collections.abc import Callable
 from contextlib import suppress
 from pathlib import Path
 
+from rich.text import Text
+
 from .config import COLORS, DEEP_AGENTS_ASCII, MAX_ARG_LENGTH, console
 
+_PATH_SEPS = tuple(sep for sep in (os.sep, os.altsep) if sep)
+
+# How long a looked-up working directory is reused before asking the OS again
+_CWD_TTL_SECONDS = 0.5
+_cwd_cache: tuple[float, Path | None] | None = None
+
 
 def truncate_value(value: str, max_length: int = MAX_ARG_LENGTH) -> str:
     """Truncate a string value if it exceeds max_length."""
@@ -17,7 +29,129 @@ def truncate_value(value: str, max_length: int = MAX_ARG_LENGTH) -> str:
     return value
 
 
-def format_tool_display(tool_name: str, tool_args: dict) -> str:  # noqa: PLR0911, PLR0912, PLR0915
+def _as_str(value: object) -> str:
+    """Return `value` as a string, skipping `str()` for the common str case."""
+    return value if type(value) is str else str(value)
+
+
+def _get_cwd() -> Path | None:
+    """Return the current working directory, re-reading it at most every 500 ms."""
+    global _cwd_cache  # noqa: PLW0603
+    now = time.monotonic()
+    if _cwd_cache is not None and now - _cwd_cache[0] < _CWD_TTL_SECONDS:
+        return _cwd_cache[1]
+    try:
+        cwd = Path.cwd()
+    except OSError:
+        cwd = None
+    _cwd_cache = (now, cwd)
+    return cwd
+
+
+def _abbreviate_path(path_str: str, max_length: int = 60) -> str:
+    """Abbreviate a file path intelligently - show basename or relative path."""
+    # A bare filename has nothing to abbreviate; skip building a Path for it
+    if not any(sep in path_str for sep in _PATH_SEPS):
+        return path_str
+
+    path = Path(path_str)
+
+    # If it's just a filename (no directory parts), return as-is
+    if len(path.parts) == 1:
+        return path_str
+
+    # Try to get relative path from current working directory
+    cwd = _get_cwd()
+    if cwd is not None:
+        with suppress(ValueError):
+            rel_path = path.relative_to(cwd)
+            rel_str = str(rel_path)
+            # Use relative if it's shorter and not too long
+            if len(rel_str) < len(path_str) and len(rel_str) <= max_length:
+                return rel_str
+
+    # If absolute path is reasonable length, use it
+    if len(path_str) <= max_length:
+        return path_str
+
+    # Otherwise, just show basename (filename only)
+    return path.name
+
+
+def _format_file_tool(tool_name: str, tool_args: dict) -> str | None:
+    # File operations: show the primary file path argument (file_path or path)
+    path_value = tool_args.get("file_path")
+    if path_value is None:
+        path_value = tool_args.get("path")
+    if path_value is not None:
+        return f"{tool_name}({_abbreviate_path(_as_str(path_value))})"
+    return None
+
+
+def _quoted_arg_formatter(arg: str, max_length: int) -> Callable[[str, dict], str | None]:
+    """Build a formatter that shows one argument, truncated and quoted."""
+
+    def formatter(tool_name: str, tool_args: dict) -> str | None:
+        if arg in tool_args:
+            # Inlined truncate_value: most values are short and need no copy
+            value = _as_str(tool_args[arg])
+            if len(value) > max_length:
+                value = value[:max_length] + "..."
+            return f'{tool_name}("{value}")'
+        return None
+
+    return formatter
+
+
+def _format_ls_tool(tool_name: str, tool_args: dict) -> str:
+    # ls: show directory, or empty if current directory
+    if tool_args.get("path"):
+        return f"{tool_name}({_abbreviate_path(_as_str(tool_args['path']))})"
+    return f"{tool_name}()"
+
+
+def _format_http_request_tool(tool_name: str, tool_args: dict) -> str | None:
+    # HTTP: show method and URL
+    parts = []
+    if "method" in tool_args:
+        parts.append(_as_str(tool_args["method"]).upper())
+    if "url" in tool_args:
+        url = _as_str(tool_args["url"])
+        if len(url) > 80:  # noqa: PLR2004 - inlined truncate_value(url, 80)
+            url = url[:80] + "..."
+        parts.append(url)
+    if parts:
+        return f"{tool_name}({' '.join(parts)})"
+    return None
+
+
+def _format_write_todos_tool(tool_name: str, tool_args: dict) -> str | None:
+    # Todos: show count of items
+    todos = tool_args.get("todos")
+    if isinstance(todos, list):
+        return f"{tool_name}({len(todos)} items)"
+    return None
+
+
+# Tool-specific formatting - each shows the most important argument(s) and
+# returns None to fall back to the generic key=value display
+_TOOL_FORMATTERS: dict[str, Callable[[str, dict], str | None]] = {
+    "read_file": _format_file_tool,
+    "write_file": _format_file_tool,
+    "edit_file": _format_file_tool,
+    "web_search": _quoted_arg_formatter("query", 100),
+    "grep": _quoted_arg_formatter("pattern", 70),
+    "shell": _quoted_arg_formatter("command", 120),
+    "ls": _format_ls_tool,
+    "glob": _quoted_arg_formatter("pattern", 80),
+    "http_request": _format_http_request_tool,
+    "fetch_url": _quoted_arg_formatter("url", 80),
+    "task": _quoted_arg_formatter("description", 100),
+    "write_todos": _format_write_todos_tool,
+}
+
+
+def format_tool_display(tool_name: str, tool_args: dict) -> str:
     """Format tool calls for display with tool-specific smart formatting.
 
     Shows the most relevant information for each tool type rather than all arguments.
@@ -34,117 +168,21 @@ def format_tool_display(tool_name: str, tool_args: dict) -> str:  # noqa: PLR091
         web_search(query="how to code", max_results=5) → 'web_search("how to code")'
         shell(command="pip install foo") → 'shell("pip install foo")'
     """
-
-    def abbreviate_path(path_str: str, max_length: int = 60) -> str:
-        """Abbreviate a file path intelligently - show basename or relative path."""
-        path = Path(path_str)
-
-        # If it's just a filename (no directory parts), return as-is
-        if len(path.parts) == 1:
-            return path_str
-
-        # Try to get relative path from current working directory
-        try:
-            cwd = Path.cwd()
-        except OSError:
-            cwd = None
-
-        if cwd is not None:
-            with suppress(ValueError):
-                rel_path = path.relative_to(cwd)
-                rel_str = str(rel_path)
-                # Use relative if it's shorter and not too long
-                if len(rel_str) < len(path_str) and len(rel_str) <= max_length:
-                    return rel_str
-
-        # If absolute path is reasonable length, use it
-        if len(path_str) <= max_length:
-            return path_str
-
-        # Otherwise, just show basename (filename only)
-        return path.name
-
-    # Tool-specific formatting - show the most important argument(s)
-    if tool_name in ("read_file", "write_file", "edit_file"):
-        # File operations: show the primary file path argument (file_path or path)
-        path_value = tool_args.get("file_path")
-        if path_value is None:
-            path_value = tool_args.get("path")
-        if path_value is not None:
-            path = abbreviate_path(str(path_value))
-            return f"{tool_name}({path})"
-
-    elif tool_name == "web_search":
-        # Web search: show the query string
-        if "query" in tool_args:
-            query = str(tool_args["query"])
-            query = truncate_value(query, 100)
-            return f'{tool_name}("{query}")'
-
-    elif tool_name == "grep":
-        # Grep: show the search pattern
-        if "pattern" in tool_args:
-            pattern = str(tool_args["pattern"])
-            pattern = truncate_value(pattern, 70)
-            return f'{tool_name}("{pattern}")'
-
-    elif tool_name == "shell":
-        # Shell: show the command being executed
-        if "command" in tool_args:
-            command = str(tool_args["command"])
-            command = truncate_value(command, 120)
-            return f'{tool_name}("{command}")'
-
-    elif tool_name == "ls":
-        # ls: show directory, or empty if current directory
-        if tool_args.get("path"):
-            path = abbreviate_path(str(tool_args["path"]))
-            return f"{tool_name}({path})"
-        return f"{tool_name}()"
-
-    elif tool_name == "glob":
-        # Glob: show the pattern
-        if "pattern" in tool_args:
-            pattern = str(tool_args["pattern"])
-            pattern = truncate_value(pattern, 80)
-            return f'{tool_name}("{pattern}")'
-
-    elif tool_name == "http_request":
-        # HTTP: show method and URL
-        parts = []
-        if "method" in tool_args:
-            parts.append(str(tool_args["method"]).upper())
-        if "url" in tool_args:
-            url = str(tool_args["url"])
-            url = truncate_value(url, 80)
-            parts.append(url)
-        if parts:
-            return f"{tool_name}({' '.join(parts)})"
-
-    elif tool_name == "fetch_url":
-        # Fetch URL: show the URL being fetched
-        if "url" in tool_args:
-            url = str(tool_args["url"])
-            url = truncate_value(url, 80)
-            return f'{tool_name}("{url}")'
-
-    elif tool_name == "task":
-        # Task: show the task description
-        if "description" in tool_args:
-            desc = str(tool_args["description"])
-            desc = truncate_value(desc, 100)
-            return f'{tool_name}("{desc}")'
-
-    elif tool_name == "write_todos":
-        # Todos: show count of items
-        if "todos" in tool_args and isinstance(tool_args["todos"], list):
-            count = len(tool_args["todos"])
-            return f"{tool_name}({count} items)"
+    formatter = _TOOL_FORMATTERS.get(tool_name)
+    if formatter is not None:
+        display = formatter(tool_name, tool_args)
+        if display is not None:
+            return display
 
     # Fallback: generic formatting for unknown tools
     # Show all arguments in key=value format
-    args_str = ", ".join(f"{k}={truncate_value(str(v), 50)}" for k, v in tool_args.items())
-    return f"{tool_name}({args_str})"
+    arg_parts = []
+    for k, v in tool_args.items():
+        value = _as_str(v)
+        if len(value) > 50:  # noqa: PLR2004 - inlined truncate_value(value, 50)
+            value = value[:50] + "..."
+        arg_parts.append(f"{k}={value}")
+    return f"{tool_name}({', '.join(arg_parts)})"
 
 
 def format_tool_message_content(content: object) -> str:
@@ -152,6 +190,12 @@ def format_tool_message_content(content: object) -> str:
     if content is None:
         return ""
     if isinstance(content, list):
+        # Fast path: every item is a string or JSON-serializable
+        with suppress(TypeError, ValueError):
+            return "\n".join(
+                [item if isinstance(item, str) else json.dumps(item) for item in content]
+            )
+        # Some item is not serializable; fall back to str() for those only
         parts = []
         for item in content:
             if isinstance(item, str):
@@ -165,81 +209,107 @@ def format_tool_message_content(content: object) -> str:
     return str(content)
 
 
+@functools.cache
+def _help_text() -> Text:
+    """Build the `deepagents help` output once, as a single Rich `Text`.
+
+    Each line goes through `console.render_str` (markup and the console
+    highlighter) and gets its style as the base style, as a separate
+    `console.print(line, style=...)` would.
+    """
+    primary = COLORS["primary"]
+    dim = COLORS["dim"]
+
+    def section(title: str, lines: list[str], style: str = "") -> list[tuple[str, str]]:
+        return [
+            (f"[bold]{title}:[/bold]", primary),
+            *((line, style) for line in lines),
+            ("", ""),
+        ]
+
+    lines: list[tuple[str, str]] = [
+        ("", ""),
+        (DEEP_AGENTS_ASCII, f"bold {primary}"),
+        ("", ""),
+        *section(
+            "Usage",
+            [
+                "  deepagents [OPTIONS]                           Start interactive session",
+                "  deepagents list                                List all available agents",
+                "  deepagents reset --agent AGENT                 Reset agent to default prompt",
+                (
+                    "  deepagents reset --agent AGENT --target SOURCE Reset "
+                    "agent to copy of another agent"
+                ),
+                "  deepagents help                                Show this help message",
+            ],
+        ),
+        *section(
+            "Options",
+            [
+                "  --agent NAME                  Agent identifier (default: agent)",
+                (
+                    "  --model MODEL                 "
+                    "Model to use (e.g., claude-sonnet-4-5-20250929, gpt-4o)"
+                ),
+                "  --auto-approve                Auto-approve tool usage without prompting",
+                (
+                    "  --sandbox TYPE                "
+                    "Remote sandbox for execution (modal, runloop, daytona)"
+                ),
+                "  --sandbox-id ID               Reuse existing sandbox (skips creation/cleanup)",
+                (
+                    "  -r, --resume [ID]             "
+                    "Resume thread: -r for most recent, -r <ID> for specific"
+                ),
+            ],
+        ),
+        *section(
+            "Examples",
+            [
+                "  deepagents                              # Start with default agent",
+                "  deepagents --agent mybot                # Start with agent named 'mybot'",
+                (
+                    "  deepagents --model gpt-4o               "
+                    "# Use specific model (auto-detects provider)"
+                ),
+                "  deepagents -r                           # Resume most recent session",
+                "  deepagents -r abc123                    # Resume specific thread",
+                "  deepagents --auto-approve               # Start with auto-approve enabled",
+                "  deepagents --sandbox runloop            # Execute code in Runloop sandbox",
+            ],
+            dim,
+        ),
+        *section(
+            "Thread Management",
+            [
+                "  deepagents threads list                 # List all sessions",
+                "  deepagents threads delete <ID>          # Delete a session",
+            ],
+            dim,
+        ),
+        *section(
+            "Interactive Features",
+            [
+                "  Enter           Submit your message",
+                "  Ctrl+J          Insert newline",
+                "  Shift+Tab       Toggle auto-approve mode",
+                "  @filename       Auto-complete files and inject content",
+                "  /command        Slash commands (/help, /clear, /quit)",
+                "  !command        Run bash commands directly",
+            ],
+            dim,
+        ),
+    ]
+    rendered = []
+    for line, style in lines:
+        text = console.render_str(line)
+        text.style = style
+        rendered.append(text)
+    return Text("\n").join(rendered)
+
+
 def show_help() -> None:
     """Show help information."""
-    console.print()
-    console.print(DEEP_AGENTS_ASCII, style=f"bold {COLORS['primary']}")
-    console.print()
-
-    console.print("[bold]Usage:[/bold]", style=COLORS["primary"])
-    console.print("  deepagents [OPTIONS]                           Start interactive session")
-    console.print("  deepagents list                                List all available agents")
-    console.print("  deepagents reset --agent AGENT                 Reset agent to default prompt")
-    console.print(
-        "  deepagents reset --agent AGENT --target SOURCE Reset agent to copy of another agent"
-    )
-    console.print("  deepagents help                                Show this help message")
-    console.print()
-
-    console.print("[bold]Options:[/bold]", style=COLORS["primary"])
-    console.print("  --agent NAME                  Agent identifier (default: agent)")
-    console.print(
-        "  --model MODEL                 Model to use (e.g., claude-sonnet-4-5-20250929, gpt-4o)"
-    )
-    console.print("  --auto-approve                Auto-approve tool usage without prompting")
-    console.print(
-        "  --sandbox TYPE                Remote sandbox for execution (modal, runloop, daytona)"
-    )
-    console.print("  --sandbox-id ID               Reuse existing sandbox (skips creation/cleanup)")
-    console.print(
-        "  -r, --resume [ID]             Resume thread: -r for most recent, -r <ID> for specific"
-    )
-    console.print()
-
-    console.print("[bold]Examples:[/bold]", style=COLORS["primary"])
-    console.print(
-        "  deepagents                              # Start with default agent", style=COLORS["dim"]
-    )
-    console.print(
-        "  deepagents --agent mybot                # Start with agent named 'mybot'",
-        style=COLORS["dim"],
-    )
-    console.print(
-        "  deepagents --model gpt-4o               # Use specific model (auto-detects provider)",
-        style=COLORS["dim"],
-    )
-    console.print(
-        "  deepagents -r                           # Resume most recent session",
-        style=COLORS["dim"],
-    )
-    console.print(
-        "  deepagents -r abc123                    # Resume specific thread",
-        style=COLORS["dim"],
-    )
-    console.print(
-        "  deepagents --auto-approve               # Start with auto-approve enabled",
-        style=COLORS["dim"],
-    )
-    console.print(
-        "  deepagents --sandbox runloop            # Execute code in Runloop sandbox",
-        style=COLORS["dim"],
-    )
-    console.print()
-
-    console.print("[bold]Thread Management:[/bold]", style=COLORS["primary"])
-    console.print(
-        "  deepagents threads list                 # List all sessions", style=COLORS["dim"]
-    )
-    console.print(
-        "  deepagents threads delete <ID>          # Delete a session", style=COLORS["dim"]
-    )
-    console.print()
-
-    console.print("[bold]Interactive Features:[/bold]", style=COLORS["primary"])
-    console.print("  Enter           Submit your message", style=COLORS["dim"])
-    console.print("  Ctrl+J          Insert newline", style=COLORS["dim"])
-    console.print("  Shift+Tab       Toggle auto-approve mode", style=COLORS["dim"])
-    console.print("  @filename       Auto-complete files and inject content", style=COLORS["dim"])
-    console.print("  /command        Slash commands (/help, /clear, /quit)", style=COLORS["dim"])
-    console.print("  !command        Run bash commands directly", style=COLORS["dim"])
-    console.print()
+    # Static, so rendered once; written with a single console call
+    console.print(_help_text())
@@ -337,6 +337,10 @@ class ChatInput(Vertical):
 
         self._text_area.focus()
 
+    def on_unmount(self) -> None:
+        """Release the history file handle."""
+        self._history.close()
+
     def on_text_area_changed(self, event: TextArea.Changed) -> None:
         """Detect input mode and update completions."""
         text = event.text_area.text
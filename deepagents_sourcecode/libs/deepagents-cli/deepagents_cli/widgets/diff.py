@@ -5,7 +5,6 @@ Enhanced diff widget for displaying unified diffs.
 
 from __future__ import annotations
 
-import re
 from typing import TYPE_CHECKING, Any
 
 from textual.containers import Vertical
@@ -24,16 +23,84 @@ def _escape_markup(text: str) -> str:
     Returns:
         Escaped text safe for Rich rendering
     """
+    # Most source lines have no brackets at all; hand those back untouched
+    if "[" not in text and "]" not in text:
+        return text
     # Escape brackets that could be interpreted as markup
     return text.replace("[", r"\[").replace("]", r"\]")
 
 
-def format_diff_textual(diff: str, max_lines: int | None = 100) -> str:  # noqa: PLR0912
+def _parse_hunk_header(line: str) -> tuple[int, int] | None:
+    """Parse the start lines of a hunk header.
+
+    Args:
+        line: Diff line, e.g. "@@ -OLD[,COUNT] +NEW[,COUNT] @@"
+
+    Returns:
+        Tuple of (old_start, new_start), or None if the line is not a hunk header
+    """
+    if not line.startswith("@@ -"):
+        return None
+    old_range, _, rest = line[4:].partition(" ")
+    old_start, comma, old_count = old_range.partition(",")
+    new_start = rest[1:].partition(",")[0].partition(" ")[0]
+    if (
+        not rest.startswith("+")
+        or not old_start.isdecimal()
+        or (comma and not old_count.isdecimal())
+        or not new_start.isdecimal()
+    ):
+        return None
+    return int(old_start), int(new_start)
+
+
+def _scan_diff(
+    lines: list[str], *, count_stats: bool
+) -> tuple[dict[int, tuple[int, int]], int, tuple[int, int]]:
+    """Pre-pass over the diff lines before rendering.
+
+    Parses hunk headers once (their start numbers give the gutter width and are
+    reused by the render loop, keyed by line index) and optionally counts stats.
+
+    Args:
+        lines: Diff lines
+        count_stats: Whether to count additions and deletions
+
+    Returns:
+        Tuple of (hunk starts by line index, largest hunk start line,
+        (additions, deletions)); the stats are (0, 0) unless `count_stats`
+    """
+    additions = deletions = 0
+    hunk_starts: dict[int, tuple[int, int]] = {}
+    max_line = 0
+    for i, line in enumerate(lines):
+        marker = line[:1]
+        if marker == "@":
+            if (hunk_start := _parse_hunk_header(line)) is not None:
+                hunk_starts[i] = hunk_start
+                max_line = max(max_line, *hunk_start)
+        elif count_stats:
+            if marker == "+":
+                if not line.startswith("+++"):
+                    additions += 1
+            elif marker == "-" and not line.startswith("---"):
+                deletions += 1
+    return hunk_starts, max_line, (additions, deletions)
+
+
+def format_diff_textual(  # noqa: PLR0912
+    diff: str,
+    max_lines: int | None = 100,
+    *,
+    stats: tuple[int, int] | None = None,
+) -> str:
     """Format a unified diff with line numbers and colors.
 
     Args:
         diff: Unified diff string
         max_lines: Maximum number of diff lines to show (None for unlimited)
+        stats: Precomputed (additions, deletions) for `diff`, if the caller
+            already has them; computed here otherwise
 
     Returns:
         Rich-formatted diff string with line numbers
@@ -43,15 +110,8 @@ def format_diff_textual(diff: str, max_lines: int | None = 100) -> str:  # noqa:
 
     lines = diff.splitlines()
 
-    # Compute stats first
-    additions = sum(1 for ln in lines if ln.startswith("+") and not ln.startswith("+++"))
-    deletions = sum(1 for ln in lines if ln.startswith("-") and not ln.startswith("---"))
-
-    # Find max line number for width calculation
-    max_line = 0
-    for line in lines:
-        if m := re.match(r"@@ -(\d+)(?:,\d+)? \+(\d+)", line):
-            max_line = max(max_line, int(m.group(1)), int(m.group(2)))
+    hunk_starts, max_line, counted = _scan_diff(lines, count_stats=stats is None)
+    additions, deletions = stats if stats is not None else counted
     width = max(3, len(str(max_line + len(lines))))
 
     formatted = []
@@ -69,7 +129,7 @@ def format_diff_textual(diff: str, max_lines: int | None = 100) -> str:  # noqa:
     old_num = new_num = 0
     line_count = 0
 
-    for line in lines:
+    for i, line in enumerate(lines):
         if max_lines and line_count >= max_lines:
             formatted.append(f"\n[dim]... ({len(lines) - line_count} more lines)[/dim]")
             break
@@ -79,35 +139,34 @@ def format_diff_textual(diff: str, max_lines: int | None = 100) -> str:  # noqa:
             continue
 
         # Handle hunk headers - just update line numbers, don't display
-        if m := re.match(r"@@ -(\d+)(?:,\d+)? \+(\d+)", line):
-            old_num, new_num = int(m.group(1)), int(m.group(2))
+        if (hunk_start := hunk_starts.get(i)) is not None:
+            old_num, new_num = hunk_start
             continue
 
-        # Handle diff lines - use gutter bar instead of +/- prefix
-        content = line[1:] if line else ""
-        escaped_content = _escape_markup(content)
-
-        if line.startswith("-"):
-            # Deletion - red gutter bar, subtle red background
-            formatted.append(
-                f"[red bold]▌[/red bold][dim]{old_num:>{width}}[/dim] "
-                f"[on #2d1515]{escaped_content}[/on #2d1515]"
-            )
-            old_num += 1
-            line_count += 1
-        elif line.startswith("+"):
-            # Addition - green gutter bar, subtle green background
-            formatted.append(
-                f"[green bold]▌[/green bold][dim]{new_num:>{width}}[/dim] "
-                f"[on #152d15]{escaped_content}[/on #152d15]"
-            )
-            new_num += 1
-            line_count += 1
-        elif line.startswith(" "):
-            # Context line - dim gutter
-            formatted.append(f"[dim]│{old_num:>{width}}[/dim]  {escaped_content}")
-            old_num += 1
-            new_num += 1
+        # Handle diff lines - use gutter bar instead of +/- prefix. Only lines
+        # that are rendered pay for slicing and escaping their content
+        marker = line[:1]
+        if marker in ("-", "+", " "):
+            escaped_content = _escape_markup(line[1:])
+            if marker == "-":
+                # Deletion - red gutter bar, subtle red background
+                formatted.append(
+                    f"[red bold]▌[/red bold][dim]{old_num:>{width}}[/dim] "
+                    f"[on #2d1515]{escaped_content}[/on #2d1515]"
+                )
+                old_num += 1
+            elif marker == "+":
+                # Addition - green gutter bar, subtle green background
+                formatted.append(
+                    f"[green bold]▌[/green bold][dim]{new_num:>{width}}[/dim] "
+                    f"[on #152d15]{escaped_content}[/on #152d15]"
+                )
+                new_num += 1
+            else:
+                # Context line - dim gutter
+                formatted.append(f"[dim]│{old_num:>{width}}[/dim]  {escaped_content}")
+                old_num += 1
+                new_num += 1
             line_count += 1
         elif line.strip() == "...":
             # Truncation marker
@@ -184,7 +243,7 @@ class EnhancedDiff(Vertical):
         """Compose the diff widget layout."""
         yield Static(f"[bold cyan]═══ {self._title} ═══[/bold cyan]", classes="diff-title")
 
-        formatted = format_diff_textual(self._diff, self._max_lines)
+        formatted = format_diff_textual(self._diff, self._max_lines, stats=self._stats)
         yield Static(formatted, classes="diff-content")
 
         additions, deletions = self._stats
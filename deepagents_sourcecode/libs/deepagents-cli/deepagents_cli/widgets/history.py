@@ -2,8 +2,37 @@
 
 from __future__ import annotations
 
+import contextlib
 import json
 from pathlib import Path  # noqa: TC003 - used at runtime in type hints
+from typing import TextIO
+
+try:
+    import fcntl
+except ImportError:  # Windows
+    fcntl = None  # type: ignore[assignment]
+
+
+def _decode_entry(line: str) -> str:
+    """Decode one JSON-lines history entry, keeping undecodable lines verbatim."""
+    # Fast path: a quoted string with nothing to unescape decodes to its inner text
+    if len(line) >= 2 and line[0] == '"' and line[-1] == '"':  # noqa: PLR2004
+        inner = line[1:-1]
+        if "\\" not in inner and '"' not in inner and inner.isprintable():
+            return inner
+    try:
+        entry = json.loads(line)
+    except json.JSONDecodeError:
+        return line
+    return entry if isinstance(entry, str) else str(entry)
+
+
+def _encode_entry(text: str) -> str:
+    """Encode one history entry as a JSON-lines record, newline included."""
+    # Fast path: printable ASCII without quotes or backslashes needs no escaping
+    if text.isascii() and text.isprintable() and '"' not in text and "\\" not in text:
+        return f'"{text}"\n'
+    return json.dumps(text) + "\n"
 
 
 class HistoryManager:
@@ -25,37 +54,57 @@ class HistoryManager:
         self._entries: list[str] = []
         self._current_index: int = -1
         self._temp_input: str = ""
+        self._fp: TextIO | None = None
         self._load_history()
 
     def _load_history(self) -> None:
         """파일에서 히스토리를 로드합니다."""
-        if not self.history_file.exists():
-            return
-
         try:
-            with self.history_file.open("r", encoding="utf-8") as f:
-                entries = []
-                for raw_line in f:
-                    line = raw_line.rstrip("\n\r")
-                    if not line:
-                        continue
-                    try:
-                        entry = json.loads(line)
-                    except json.JSONDecodeError:
-                        entry = line
-                    entries.append(entry if isinstance(entry, str) else str(entry))
-                self._entries = entries[-self.max_entries :]
+            text = self.history_file.read_text(encoding="utf-8")
+        except FileNotFoundError:
+            return
         except (OSError, UnicodeDecodeError):
             self._entries = []
+            return
+
+        # Only the newest max_entries survive, so slice before decoding
+        lines = [line for line in text.split("\n") if line][-self.max_entries :]
+        self._entries = [_decode_entry(line) for line in lines]
 
     def _append_to_file(self, text: str) -> None:
-        """히스토리 파일에 항목 하나를 append 합니다(concurrent-safe)."""
+        """히스토리 파일에 항목 하나를 append 합니다(concurrent-safe).
+
+        The append handle is opened once and kept; it is line-buffered, so each
+        entry reaches the file as a single write while the lock is held.
+        """
         try:
-            self.history_file.parent.mkdir(parents=True, exist_ok=True)
-            with self.history_file.open("a", encoding="utf-8") as f:
-                f.write(json.dumps(text) + "\n")
+            if self._fp is None:
+                self.history_file.parent.mkdir(parents=True, exist_ok=True)
+                self._fp = self.history_file.open("a", encoding="utf-8", buffering=1)
+            line = _encode_entry(text)
+            if fcntl is None:
+                self._fp.write(line)
+                return
+            fcntl.flock(self._fp, fcntl.LOCK_EX)
+            try:
+                self._fp.write(line)
+            finally:
+                fcntl.flock(self._fp, fcntl.LOCK_UN)
         except OSError:
-            pass
+            # Reopen on the next append rather than reusing a broken handle
+            self.close()
+
+    def close(self) -> None:
+        """열려 있는 append 핸들을 닫습니다."""
+        if self._fp is None:
+            return
+        fp, self._fp = self._fp, None
+        with contextlib.suppress(OSError):
+            fp.close()
+
+    def __del__(self) -> None:
+        """Release the append handle when the manager is collected."""
+        self.close()
 
     def _compact_history(self) -> None:
         """오래된 항목을 제거하기 위해 히스토리 파일을 재작성합니다.
@@ -65,8 +114,7 @@ class HistoryManager:
         try:
             self.history_file.parent.mkdir(parents=True, exist_ok=True)
             with self.history_file.open("w", encoding="utf-8") as f:
-                for entry in self._entries:
-                    f.write(json.dumps(entry) + "\n")
+                f.writelines(_encode_entry(entry) for entry in self._entries)
         except OSError:
             pass
 
@@ -115,6 +163,13 @@ class HistoryManager:
             self._temp_input = current_input
             self._current_index = len(self._entries)
 
+        # prefix가 없으면 모든 항목이 매칭되므로 한 칸만 이동
+        if not prefix:
+            if self._current_index > 0:
+                self._current_index -= 1
+                return self._entries[self._current_index]
+            return None
+
         # 뒤로 탐색하며 prefix에 매칭되는 항목을 찾음
         for i in range(self._current_index - 1, -1, -1):
             if self._entries[i].startswith(prefix):
@@ -135,11 +190,17 @@ class HistoryManager:
         if self._current_index == -1:
             return None
 
-        # 앞으로 탐색하며 prefix에 매칭되는 항목을 찾음
-        for i in range(self._current_index + 1, len(self._entries)):
-            if self._entries[i].startswith(prefix):
-                self._current_index = i
-                return self._entries[i]
+        if not prefix:
+            # prefix가 없으면 바로 다음 항목이 매칭됨
+            if self._current_index + 1 < len(self._entries):
+                self._current_index += 1
+                return self._entries[self._current_index]
+        else:
+            # 앞으로 탐색하며 prefix에 매칭되는 항목을 찾음
+            for i in range(self._current_index + 1, len(self._entries)):
+                if self._entries[i].startswith(prefix):
+                    self._current_index = i
+                    return self._entries[i]
 
         # 끝까지 가면 원래 입력으로 복귀
         result = self._temp_input
@@ -341,14 +341,19 @@ class ToolCallMessage(Vertical):
             full = self.query_one("#output-full", Static)
 
             output_stripped = self._output.strip()
-            lines = output_stripped.split("\n")
-            total_lines = len(lines)
             total_chars = len(output_stripped)
 
+            # Locate the end of the preview lines instead of splitting the whole
+            # output; a newline there means there are more lines than fit
+            preview_end = -1
+            for _ in range(self._PREVIEW_LINES):
+                preview_end = output_stripped.find("\n", preview_end + 1)
+                if preview_end == -1:
+                    break
+            too_many_lines = preview_end != -1
+
             # Truncate if too many lines OR too many characters
-            needs_truncation = (
-                total_lines > self._PREVIEW_LINES or total_chars > self._PREVIEW_CHARS
-            )
+            needs_truncation = too_many_lines or total_chars > self._PREVIEW_CHARS
 
             if self._expanded:
                 # Show full output
@@ -361,8 +366,8 @@ class ToolCallMessage(Vertical):
                 full.display = False
                 if needs_truncation:
                     # Truncate by lines first, then by chars
-                    if total_lines > self._PREVIEW_LINES:
-                        preview_text = "\n".join(lines[: self._PREVIEW_LINES])
+                    if too_many_lines:
+                        preview_text = output_stripped[:preview_end]
                     else:
                         preview_text = output_stripped
 
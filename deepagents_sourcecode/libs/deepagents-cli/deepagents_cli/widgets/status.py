@@ -2,11 +2,12 @@
 
 from __future__ import annotations
 
+import os
+import re
 from pathlib import Path
 from typing import TYPE_CHECKING, Any
 
 from textual.containers import Horizontal
-from textual.css.query import NoMatches
 from textual.reactive import reactive
 from textual.widgets import Static
 
@@ -15,6 +16,31 @@ if TYPE_CHECKING:
 
 TOKENS_K_THRESHOLD = 1000
 
+# 모드 → (CSS class, 표시 문자열)
+_MODE_DISPLAY = {"bash": ("bash", "BASH"), "command": ("command", "CMD")}
+_NORMAL_MODE_DISPLAY = ("normal", "")
+# 작업 중 상태 메시지("Agent is thinking...", "Executing ...")를 한 번의 검색으로 판별
+_BUSY_STATUS_RE = re.compile("thinking|executing", re.IGNORECASE)
+# auto-approve 여부 → (CSS class, 표시 문자열)
+_AUTO_APPROVE_DISPLAY = {
+    True: ("on", "auto | shift+tab to cycle"),
+    False: ("off", "manual | shift+tab to cycle"),
+}
+
+
+def format_token_count(count: int) -> str:
+    """토큰 수를 표시용 문자열로 변환합니다(천 단위는 K suffix).
+
+    Args:
+        count: Token count
+
+    Returns:
+        e.g. "950" or "12.3K"
+    """
+    if count >= TOKENS_K_THRESHOLD:
+        return f"{count / TOKENS_K_THRESHOLD:.1f}K"
+    return str(count)
+
 
 class StatusBar(Horizontal):
     """모드/자동 승인/작업 디렉토리 등을 표시하는 상태 표시줄입니다."""
@@ -91,6 +117,12 @@ class StatusBar(Horizontal):
     cwd: reactive[str] = reactive("", init=False)
     tokens: reactive[int] = reactive(0, init=False)
 
+    # 자식 Static 참조(on_mount에서 한 번만 조회)
+    _mode_indicator: Static
+    _auto_approve_indicator: Static
+    _status_message_widget: Static
+    _tokens_display: Static
+
     def __init__(self, cwd: str | Path | None = None, **kwargs: Any) -> None:
         """상태 표시줄을 초기화합니다.
 
@@ -101,13 +133,30 @@ class StatusBar(Horizontal):
         super().__init__(**kwargs)
         # 초기 cwd를 저장(compose()에서 사용)
         self._initial_cwd = str(cwd) if cwd else str(Path.cwd())
+        # 같은 tick 안에서 들어온 상태 메시지/토큰 갱신을 모아 한 번에 반영
+        self._pending: dict[str, Any] = {}
+        self._flush_scheduled = False
+        # 홈 디렉토리는 한 번만 조회해 두고 cwd 표시는 문자열 비교로 처리
+        try:
+            self._home_str: str | None = str(Path.home())
+        except RuntimeError:
+            self._home_str = None
+        self._home_prefix = (self._home_str or "").rstrip(os.sep) + os.sep
+        # on_mount에서 자식 Static 참조를 채운 뒤 True가 됨(그 전에는 watcher가 아무 것도 하지 않음)
+        self._mounted = False
+        # 인디케이터에 현재 적용된 CSS class(바뀔 때만 교체)
+        self._mode_class = _NORMAL_MODE_DISPLAY[0]
+        self._auto_approve_class = _AUTO_APPROVE_DISPLAY[False][0]
+        # 마지막으로 표시한 토큰 텍스트(같으면 Static.update 생략)
+        self._last_tokens_text: str | None = None
 
     def compose(self) -> ComposeResult:
         """상태 표시줄 레이아웃을 구성합니다."""
         yield Static("", classes="status-mode normal", id="mode-indicator")
+        auto_class, auto_label = _AUTO_APPROVE_DISPLAY[False]
         yield Static(
-            "manual | shift+tab to cycle",
-            classes="status-auto-approve off",
+            auto_label,
+            classes=f"status-auto-approve {auto_class}",
             id="auto-approve-indicator",
         )
         yield Static("", classes="status-message", id="status-message")
@@ -116,75 +165,104 @@ class StatusBar(Horizontal):
 
     def on_mount(self) -> None:
         """마운트(on_mount) 이후 reactive 값을 설정해 watcher가 안전하게 동작하도록 합니다."""
+        self._mode_indicator = self.query_one("#mode-indicator", Static)
+        self._auto_approve_indicator = self.query_one("#auto-approve-indicator", Static)
+        self._status_message_widget = self.query_one("#status-message", Static)
+        self._tokens_display = self.query_one("#tokens-display", Static)
+        self._mounted = True
         self.cwd = self._initial_cwd
 
     def watch_mode(self, mode: str) -> None:
         """모드(mode) 변경 시 표시를 갱신합니다."""
-        try:
-            indicator = self.query_one("#mode-indicator", Static)
-        except NoMatches:
+        mode_class, label = _MODE_DISPLAY.get(mode, _NORMAL_MODE_DISPLAY)
+        if not self._mounted or mode_class == self._mode_class:
             return
-        indicator.remove_class("normal", "bash", "command")
-
-        if mode == "bash":
-            indicator.update("BASH")
-            indicator.add_class("bash")
-        elif mode == "command":
-            indicator.update("CMD")
-            indicator.add_class("command")
-        else:
-            indicator.update("")
-            indicator.add_class("normal")
+        indicator = self._mode_indicator
+        indicator.remove_class(self._mode_class)
+        indicator.add_class(mode_class)
+        indicator.update(label)
+        self._mode_class = mode_class
 
     def watch_auto_approve(self, new_value: bool) -> None:  # noqa: FBT001
         """auto-approve 상태 변경 시 표시를 갱신합니다."""
-        try:
-            indicator = self.query_one("#auto-approve-indicator", Static)
-        except NoMatches:
-            return
-        indicator.remove_class("on", "off")
-
-        if new_value:
-            indicator.update("auto | shift+tab to cycle")
-            indicator.add_class("on")
-        else:
-            indicator.update("manual | shift+tab to cycle")
-            indicator.add_class("off")
-
-    def watch_cwd(self, new_value: str) -> None:
-        """작업 디렉토리(cwd) 변경 시 표시를 갱신합니다."""
-        try:
-            display = self.query_one("#cwd-display", Static)
-        except NoMatches:
+        auto_class, label = _AUTO_APPROVE_DISPLAY[bool(new_value)]
+        if not self._mounted or auto_class == self._auto_approve_class:
             return
-        display.update(self._format_cwd(new_value))
+        indicator = self._auto_approve_indicator
+        indicator.remove_class(self._auto_approve_class)
+        indicator.add_class(auto_class)
+        indicator.update(label)
+        self._auto_approve_class = auto_class
 
     def watch_status_message(self, new_value: str) -> None:
         """상태 메시지(status message) 변경 시 표시를 갱신합니다."""
-        try:
-            msg_widget = self.query_one("#status-message", Static)
-        except NoMatches:
+        if not self._mounted:
             return
+        msg_widget = self._status_message_widget
+        msg_widget.update(new_value)
+        msg_widget.set_class(_BUSY_STATUS_RE.search(new_value) is not None, "thinking")
 
-        msg_widget.remove_class("thinking")
-        if new_value:
-            msg_widget.update(new_value)
-            if "thinking" in new_value.lower() or "executing" in new_value.lower():
-                msg_widget.add_class("thinking")
-        else:
-            msg_widget.update("")
+    @property
+    def formatted_cwd(self) -> str:
+        """표시용으로 포맷팅된 현재 작업 디렉토리(홈은 ~로 축약)입니다.
+
+        The status bar does not pin the cwd itself (it is shown in the welcome
+        banner), so this is computed on demand rather than on every cwd change.
+        """
+        return self._format_cwd()
 
     def _format_cwd(self, cwd_path: str = "") -> str:
         """표시용으로 현재 작업 디렉토리를 포맷팅합니다."""
-        path = Path(cwd_path or self.cwd or self._initial_cwd)
-        try:
-            # 홈 디렉토리는 ~로 표시 시도
-            home = Path.home()
-            if path.is_relative_to(home):
-                return "~/" + str(path.relative_to(home))
-        except (ValueError, RuntimeError):
-            pass
-        return str(path)
+        path = cwd_path or self.cwd or self._initial_cwd
+        if self._home_str:
+            # 홈 디렉토리는 ~로 표시
+            if path == self._home_str:
+                return "~"
+            if path.startswith(self._home_prefix):
+                return "~/" + path[len(self._home_prefix) :]
+        return path
+
+    def update_state(
+        self,
+        *,
+        mode: str | None = None,
+        message: str | None = None,
+        auto_approve: bool | None = None,
+        tokens: int | None = None,
+    ) -> None:
+        """여러 상태 값을 한 번의 repaint로 갱신합니다.
+
+        Args:
+            mode: Input mode, if changed
+            message: Status message, if changed (empty string to clear)
+            auto_approve: Auto-approve state, if changed
+            tokens: Current context token count, if changed
+        """
+        with self.app.batch_update():
+            if mode is not None:
+                self.mode = mode
+            if message is not None:
+                self.status_message = message
+            if auto_approve is not None:
+                self.auto_approve = auto_approve
+            if tokens is not None:
+                self.tokens = tokens
+
+    def _queue_update(self, field: str, value: object) -> None:
+        """갱신을 예약해 다음 refresh 직전에 모아서 반영합니다."""
+        if not self._mounted:
+            setattr(self, field, value)
+            return
+        self._pending[field] = value
+        if not self._flush_scheduled:
+            self._flush_scheduled = True
+            self.call_after_refresh(self._flush_pending)
+
+    def _flush_pending(self) -> None:
+        """예약된 갱신을 한 번에 반영합니다."""
+        self._flush_scheduled = False
+        pending, self._pending = self._pending, {}
+        self.update_state(message=pending.get("status_message"), tokens=pending.get("tokens"))
 
     def set_mode(self, mode: str) -> None:
         """현재 입력 모드를 설정합니다.
@@ -208,23 +286,18 @@ class StatusBar(Horizontal):
         Args:
             message: Status message to display (empty string to clear)
         """
-        self.status_message = message
+        self._queue_update("status_message", message)
 
     def watch_tokens(self, new_value: int) -> None:
         """토큰 수 변경 시 표시를 갱신합니다."""
-        try:
-            display = self.query_one("#tokens-display", Static)
-        except NoMatches:
+        if not self._mounted:
             return
-
-        if new_value > 0:
-            # 천 단위는 K suffix로 표시
-            if new_value >= TOKENS_K_THRESHOLD:
-                display.update(f"{new_value / TOKENS_K_THRESHOLD:.1f}K tokens")
-            else:
-                display.update(f"{new_value} tokens")
-        else:
-            display.update("")
+        text = f"{format_token_count(new_value)} tokens" if new_value > 0 else ""
+        # 12,340 -> 12,345처럼 표시 문자열이 같으면 다시 그릴 필요가 없음
+        if text == self._last_tokens_text:
+            return
+        self._tokens_display.update(text)
+        self._last_tokens_text = text
 
     def set_tokens(self, count: int) -> None:
         """토큰 수를 설정합니다.
@@ -232,4 +305,4 @@ class StatusBar(Horizontal):
         Args:
             count: Current context token count
         """
-        self.tokens = count
+        self._queue_update("tokens", count)
@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 import difflib
+import os
 from typing import TYPE_CHECKING, Any
 
 from deepagents_cli.widgets.tool_widgets import (
@@ -16,11 +17,55 @@ if TYPE_CHECKING:
     from deepagents_cli.widgets.tool_widgets import ToolApprovalWidget
 
 DIFF_HEADER_LINES = 2
+DIFF_CONTEXT_LINES = 3
+
+# 파일 확장자 → 코드 블록 언어 이름(매핑에 없으면 확장자를 그대로 사용)
+_EXT_TO_LEXER = {
+    ".py": "python",
+    ".ts": "typescript",
+    ".js": "javascript",
+    ".md": "markdown",
+    ".json": "json",
+    ".yaml": "yaml",
+    ".yml": "yaml",
+    ".rs": "rust",
+    ".go": "go",
+    ".toml": "toml",
+}
+
+
+def _format_hunk_range(start: int, stop: int) -> str:
+    """Hunk 헤더의 `start[,length]` 범위를 `difflib.unified_diff`와 같은 형식으로 만듭니다."""
+    length = stop - start
+    if length == 1:
+        return str(start + 1)
+    # 빈 범위는 바로 앞 라인 번호로 표시
+    return f"{start + 1 if length else start},{length}"
+
+
+def _format_hunk(
+    opcodes: list[tuple[str, int, int, int, int]], old_lines: list[str], new_lines: list[str]
+) -> list[str]:
+    """전체 라인 기준 opcode 그룹 하나를 unified diff hunk 라인으로 만듭니다."""
+    old_range = _format_hunk_range(opcodes[0][1], opcodes[-1][2])
+    new_range = _format_hunk_range(opcodes[0][3], opcodes[-1][4])
+    hunk = [f"@@ -{old_range} +{new_range} @@"]
+    for tag, i1, i2, j1, j2 in opcodes:
+        if tag == "equal":
+            hunk.extend(" " + line for line in old_lines[i1:i2])
+            continue
+        if tag in {"replace", "delete"}:
+            hunk.extend("-" + line for line in old_lines[i1:i2])
+        if tag in {"replace", "insert"}:
+            hunk.extend("+" + line for line in new_lines[j1:j2])
+    return hunk
 
 
 class ToolRenderer:
     """tool 승인 위젯 렌더러의 베이스 클래스입니다."""
 
+    __slots__ = ()
+
     def get_approval_widget(
         self, tool_args: dict[str, Any]
     ) -> tuple[type[ToolApprovalWidget], dict[str, Any]]:
@@ -38,6 +83,8 @@ class ToolRenderer:
 class WriteFileRenderer(ToolRenderer):
     """`write_file` tool 렌더러(전체 파일 내용을 표시)."""
 
+    __slots__ = ()
+
     def get_approval_widget(
         self, tool_args: dict[str, Any]
     ) -> tuple[type[ToolApprovalWidget], dict[str, Any]]:
@@ -46,10 +93,9 @@ class WriteFileRenderer(ToolRenderer):
         file_path = tool_args.get("file_path", "")
         content = tool_args.get("content", "")
 
-        # 파일 확장자
-        file_extension = "text"
-        if "." in file_path:
-            file_extension = file_path.rsplit(".", 1)[-1]
+        # 파일 확장자(디렉토리 이름의 점이나 dotfile은 확장자로 보지 않음)
+        ext = os.path.splitext(file_path)[1]  # noqa: PTH122 - plain str, no Path needed
+        file_extension = _EXT_TO_LEXER.get(ext) or ext[1:] or "text"
 
         data = {
             "file_path": file_path,
@@ -62,6 +108,8 @@ class WriteFileRenderer(ToolRenderer):
 class EditFileRenderer(ToolRenderer):
     """`edit_file` tool 렌더러(unified diff 표시)."""
 
+    __slots__ = ()
+
     def get_approval_widget(
         self, tool_args: dict[str, Any]
     ) -> tuple[type[ToolApprovalWidget], dict[str, Any]]:
@@ -83,30 +131,54 @@ class EditFileRenderer(ToolRenderer):
 
     def _generate_diff(self, old_string: str, new_string: str) -> list[str]:
         """old/new 문자열로부터 unified diff 라인을 생성합니다."""
-        if not old_string and not new_string:
+        # 변경 없는 edit(빈 문자열 포함)은 분할/diff 없이 바로 반환
+        if old_string == new_string:
             return []
 
         old_lines = old_string.split("\n") if old_string else []
         new_lines = new_string.split("\n") if new_string else []
 
-        # unified diff 생성
-        diff = difflib.unified_diff(
-            old_lines,
-            new_lines,
-            fromfile="before",
-            tofile="after",
-            lineterm="",
-            n=3,  # Context lines
+        # 공통 앞/뒤 라인은 difflib에 넘기지 않음(큰 입력에서 비용 절감)
+        limit = min(len(old_lines), len(new_lines))
+        prefix = 0
+        while prefix < limit and old_lines[prefix] == new_lines[prefix]:
+            prefix += 1
+        limit -= prefix
+        suffix = 0
+        while suffix < limit and old_lines[-1 - suffix] == new_lines[-1 - suffix]:
+            suffix += 1
+        old_end = len(old_lines) - suffix
+        new_end = len(new_lines) - suffix
+
+        # 변경된 가운데 구간만 비교. context까지 넘기면 반복되는 라인에서 정렬이 달라져
+        # diff가 커질 수 있으므로, context 라인과 hunk 범위는 여기서 직접 붙임
+        matcher = difflib.SequenceMatcher(
+            None, old_lines[prefix:old_end], new_lines[prefix:new_end]
         )
-
-        # 헤더 라인(---, +++)은 제외
-        diff_list = list(diff)
-        return diff_list[DIFF_HEADER_LINES:] if len(diff_list) > DIFF_HEADER_LINES else diff_list
+        groups = list(matcher.get_grouped_opcodes(DIFF_CONTEXT_LINES))
+        lead = min(prefix, DIFF_CONTEXT_LINES)
+        trail = min(suffix, DIFF_CONTEXT_LINES)
+        diff_lines: list[str] = []
+        for index, group in enumerate(groups):
+            # 가운데 구간 기준 인덱스를 전체 라인 기준으로 옮김
+            opcodes = [
+                (tag, i1 + prefix, i2 + prefix, j1 + prefix, j2 + prefix)
+                for tag, i1, i2, j1, j2 in group
+            ]
+            # 가운데 구간은 변경으로 시작하고 끝나므로, 앞/뒤 context는 첫/마지막 hunk에만 붙음
+            if index == 0 and lead:
+                opcodes.insert(0, ("equal", prefix - lead, prefix, prefix - lead, prefix))
+            if index == len(groups) - 1 and trail:
+                opcodes.append(("equal", old_end, old_end + trail, new_end, new_end + trail))
+            diff_lines.extend(_format_hunk(opcodes, old_lines, new_lines))
+        return diff_lines
 
 
 class BashRenderer(ToolRenderer):
     """`bash`/`shell` tool 렌더러(커맨드 표시)."""
 
+    __slots__ = ()
+
     def get_approval_widget(
         self, tool_args: dict[str, Any]
     ) -> tuple[type[ToolApprovalWidget], dict[str, Any]]:
@@ -118,13 +190,14 @@ class BashRenderer(ToolRenderer):
         return BashApprovalWidget, data
 
 
-# tool 이름 → renderer 매핑 레지스트리
-_RENDERER_REGISTRY: dict[str, type[ToolRenderer]] = {
-    "write_file": WriteFileRenderer,
-    "edit_file": EditFileRenderer,
-    "bash": BashRenderer,
-    "shell": BashRenderer,
+# tool 이름 → renderer 매핑 레지스트리(renderer는 상태가 없으므로 인스턴스를 공유)
+_RENDERER_REGISTRY: dict[str, ToolRenderer] = {
+    "write_file": WriteFileRenderer(),
+    "edit_file": EditFileRenderer(),
+    "bash": BashRenderer(),
+    "shell": BashRenderer(),
 }
+_DEFAULT_RENDERER = ToolRenderer()
 
 
 def get_renderer(tool_name: str) -> ToolRenderer:
@@ -136,5 +209,4 @@ def get_renderer(tool_name: str) -> ToolRenderer:
     Returns:
         The appropriate ToolRenderer instance
     """
-    renderer_class = _RENDERER_REGISTRY.get(tool_name, ToolRenderer)
-    return renderer_class()
+    return _RENDERER_REGISTRY.get(tool_name, _DEFAULT_RENDERER)
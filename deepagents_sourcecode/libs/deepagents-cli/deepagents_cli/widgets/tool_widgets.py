@@ -7,10 +7,13 @@ from __future__ import annotations
 
 from typing import TYPE_CHECKING, Any
 
+from rich.text import Text
 from textual.containers import Vertical
 from textual.widgets import Markdown, Static
 
 if TYPE_CHECKING:
+    from collections.abc import Sequence
+
     from textual.app import ComposeResult
 
 # Constants for display limits
@@ -19,10 +22,9 @@ _MAX_LINES = 30
 _MAX_DIFF_LINES = 50
 _MAX_PREVIEW_LINES = 20
 
-
-def _escape_markup(text: str) -> str:
-    """Escape Rich markup characters in text."""
-    return text.replace("[", r"\[").replace("]", r"\]")
+# Diff line styles, applied to Text directly so content needs no markup escaping
+_REMOVED_STYLE = "red on #3d1f1f"
+_ADDED_STYLE = "green on #1f3d1f"
 
 
 class ToolApprovalWidget(Vertical):
@@ -127,7 +129,7 @@ class EditFileApprovalWidget(ToolApprovalWidget):
             yield from self._render_strings_only(old_string, new_string)
 
     def _count_stats(
-        self, diff_lines: list[str], old_string: str, new_string: str
+        self, diff_lines: Sequence[str], old_string: str, new_string: str
     ) -> tuple[int, int]:
         """Count additions and deletions from diff data."""
         if diff_lines:
@@ -151,7 +153,7 @@ class EditFileApprovalWidget(ToolApprovalWidget):
             parts.append(f"[red]-{deletions}[/red]")
         return " ".join(parts)
 
-    def _render_diff_lines_only(self, diff_lines: list[str]) -> ComposeResult:
+    def _render_diff_lines_only(self, diff_lines: Sequence[str]) -> ComposeResult:
         """Render unified diff lines without returning stats."""
         lines_shown = 0
 
@@ -181,14 +183,12 @@ class EditFileApprovalWidget(ToolApprovalWidget):
 
     def _render_diff_line(self, line: str) -> Static | None:
         """Render a single diff line with appropriate styling."""
-        content = _escape_markup(line[1:] if len(line) > 1 else "")
-
         if line.startswith("-"):
-            return Static(f"[on #3d1f1f][red]- {content}[/red][/on #3d1f1f]")
+            return Static(Text(f"- {line[1:]}", style=_REMOVED_STYLE))
         if line.startswith("+"):
-            return Static(f"[on #1f3d1f][green]+ {content}[/green][/on #1f3d1f]")
+            return Static(Text(f"+ {line[1:]}", style=_ADDED_STYLE))
         if line.startswith(" "):
-            return Static(f"[dim]  {content}[/dim]")
+            return Static(Text(f"  {line[1:]}", style="dim"))
         if line.strip():
             return Static(line, markup=False)
         return None
@@ -196,12 +196,11 @@ class EditFileApprovalWidget(ToolApprovalWidget):
     def _render_string_lines(self, text: str, *, is_addition: bool) -> ComposeResult:
         """Render lines from a string with appropriate styling."""
         lines = text.split("\n")
-        style = "[on #1f3d1f][green]+" if is_addition else "[on #3d1f1f][red]-"
-        end_style = "[/green][/on #1f3d1f]" if is_addition else "[/red][/on #3d1f1f]"
+        prefix = "+ " if is_addition else "- "
+        style = _ADDED_STYLE if is_addition else _REMOVED_STYLE
 
         for line in lines[:_MAX_PREVIEW_LINES]:
-            escaped = _escape_markup(line)
-            yield Static(f"{style} {escaped}{end_style}")
+            yield Static(Text(prefix + line, style=style))
 
         if len(lines) > _MAX_PREVIEW_LINES:
             remaining = len(lines) - _MAX_PREVIEW_LINES
@@ -5,11 +5,52 @@ Searches the arXiv preprint repository for research papers.
 """
 
 import argparse
+import functools
+from collections.abc import Iterator
+from types import ModuleType
 
 from rich.console import Console
 
 console = Console()
 
+ARXIV_MISSING_MESSAGE = "Error: arxiv package not installed. Install with: pip install arxiv"
+
+
+@functools.cache
+def _load_arxiv() -> ModuleType:
+    """Import the arxiv package once; later searches reuse the module.
+
+    A failed import is not cached, so installing arxiv mid-session works.
+    """
+    import arxiv
+
+    return arxiv
+
+
+def iter_arxiv(query: str, max_papers: int = 10) -> Iterator[str]:
+    """Yield formatted papers as the arXiv client returns them.
+
+    Parameters
+    ----------
+    query : str
+        The search query string.
+    max_papers : int
+        The maximum number of papers to retrieve (default: 10).
+
+    Yields:
+        One entry per paper: a "Title: ..." line followed by a "Summary: ..." line.
+
+    Raises:
+        ImportError: If the arxiv package is not installed.
+    """
+    arxiv = _load_arxiv()
+    client = arxiv.Client()
+    search = arxiv.Search(
+        query=query, max_results=max_papers, sort_by=arxiv.SortCriterion.Relevance
+    )
+    for paper in client.results(search):
+        yield f"Title: {paper.title}\nSummary: {paper.summary}"
+
 
 def query_arxiv(query: str, max_papers: int = 10) -> str:
     """Query arXiv for papers based on the provided search query.
@@ -25,18 +66,9 @@ def query_arxiv(query: str, max_papers: int = 10) -> str:
         The formatted search results or an error message.
     """
     try:
-        import arxiv
+        results = "\n\n".join(iter_arxiv(query, max_papers))
     except ImportError:
-        return "Error: arxiv package not installed. Install with: pip install arxiv"
-
-    try:
-        client = arxiv.Client()
-        search = arxiv.Search(
-            query=query, max_results=max_papers, sort_by=arxiv.SortCriterion.Relevance
-        )
-        results = "\n\n".join(
-            [f"Title: {paper.title}\nSummary: {paper.summary}" for paper in client.results(search)]
-        )
+        return ARXIV_MISSING_MESSAGE
     except Exception as e:  # noqa: BLE001
         return f"Error querying arXiv: {e}"
     else:
@@ -58,7 +90,22 @@ def main() -> None:
 
     args = parser.parse_args()
 
-    console.print(query_arxiv(args.query, max_papers=args.max_papers))
+    # Print each paper as it arrives instead of waiting for the full result set
+    found = False
+    try:
+        for paper in iter_arxiv(args.query, max_papers=args.max_papers):
+            if found:
+                console.print()
+            console.print(paper)
+            found = True
+    except ImportError:
+        console.print(ARXIV_MISSING_MESSAGE)
+        return
+    except Exception as e:  # noqa: BLE001
+        console.print(f"Error querying arXiv: {e}")
+        return
+    if not found:
+        console.print("No papers found on arXiv.")
 
 
 if __name__ == "__main__":
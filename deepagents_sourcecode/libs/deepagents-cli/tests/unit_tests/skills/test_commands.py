@@ -1,10 +1,17 @@
 """Unit tests for skills command sanitization and validation."""
 
+from collections.abc import Iterator
 from pathlib import Path
+from unittest.mock import MagicMock
 
 import pytest
 
-from deepagents_cli.skills.commands import _validate_name, _validate_skill_path
+from deepagents_cli.skills import commands
+from deepagents_cli.skills.commands import (
+    _validate_agent_name,
+    _validate_name,
+    _validate_skill_path,
+)
 
 
 class TestValidateSkillName:
@@ -131,6 +138,24 @@ class TestValidateSkillName:
             assert error != ""
 
 
+class TestValidateAgentName:
+    """Test agent identifier validation for the --agent option."""
+
+    def test_valid_agent_names(self):
+        """Test that letters, numbers, hyphens, and underscores are accepted."""
+        for name in ["agent", "my_agent", "MyAgent", "agent-2", "a" * 64]:
+            is_valid, error = _validate_agent_name(name)
+            assert is_valid, f"Valid agent name '{name}' was rejected: {error}"
+            assert error == ""
+
+    def test_invalid_agent_names(self):
+        """Test that empty, overlong, and path-like agent names are rejected."""
+        for name in ["", "a" * 65, "../etc", "my/agent", "my\\agent", "agent name", "agent\n"]:
+            is_valid, error = _validate_agent_name(name)
+            assert not is_valid, f"Invalid agent name {name!r} was accepted"
+            assert error != ""
+
+
 class TestValidateSkillPath:
     """Test skill path validation to ensure paths stay within bounds."""
 
@@ -187,6 +212,36 @@ class TestValidateSkillPath:
         assert error == ""
 
 
+class TestCreateSkill:
+    """Test the skills create command."""
+
+    @pytest.fixture
+    def skills_dir(self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> Iterator[Path]:
+        skills_dir = tmp_path / "skills"
+        skills_dir.mkdir()
+        settings = MagicMock()
+        settings.ensure_user_skills_dir.return_value = skills_dir
+        commands._settings.cache_clear()
+        monkeypatch.setattr(commands.Settings, "from_environment", lambda: settings)
+        yield skills_dir
+        commands._settings.cache_clear()
+
+    def test_create_writes_template(self, skills_dir: Path) -> None:
+        commands._create("new-skill", agent="agent")
+
+        content = (skills_dir / "new-skill" / "SKILL.md").read_text()
+        assert content.startswith("---\nname: new-skill\n")
+
+    def test_create_does_not_overwrite_existing_skill(self, skills_dir: Path) -> None:
+        skill_md = skills_dir / "new-skill" / "SKILL.md"
+        skill_md.parent.mkdir()
+        skill_md.write_text("custom")
+
+        commands._create("new-skill", agent="agent")
+
+        assert skill_md.read_text() == "custom"
+
+
 class TestIntegrationSecurity:
     """Integration tests for security across the command flow."""
 
@@ -2,7 +2,7 @@
 
 from pathlib import Path
 
-from deepagents_cli.skills.load import list_skills
+from deepagents_cli.skills.load import invalidate_skills_cache, list_skills
 
 
 class TestListSkillsSingleDirectory:
@@ -41,6 +41,7 @@ This is a test skill.
         assert skills[0]["description"] == "A test skill"
         assert skills[0]["source"] == "user"
         assert Path(skills[0]["path"]) == skill_md
+        assert skills[0]["dir"] == str(skill_dir)
 
     def test_list_skills_source_parameter(self, tmp_path: Path) -> None:
         """Test that source parameter is correctly set for project skills."""
@@ -104,6 +105,24 @@ Content
         skills = list_skills(user_skills_dir=skills_dir, project_skills_dir=None)
         assert skills == []
 
+    def test_list_skills_duplicate_names_in_directory(self, tmp_path: Path) -> None:
+        """Test that two skills declaring the same name are listed only once."""
+        skills_dir = tmp_path / "skills"
+        skills_dir.mkdir()
+
+        for dir_name in ("alpha", "beta"):
+            skill_dir = skills_dir / dir_name
+            skill_dir.mkdir()
+            (skill_dir / "SKILL.md").write_text(f"""---
+name: shared-skill
+description: From {dir_name}
+---
+Content
+""")
+
+        skills = list_skills(user_skills_dir=skills_dir, project_skills_dir=None)
+        assert [s["name"] for s in skills] == ["shared-skill"]
+
     def test_list_skills_nonexistent_directory(self, tmp_path: Path) -> None:
         """Test listing skills from a non-existent directory."""
         skills_dir = tmp_path / "nonexistent"
@@ -290,3 +309,45 @@ Content
         skills = list_skills(user_skills_dir=user_dir, project_skills_dir=None)
         assert len(skills) == 1
         assert skills[0]["name"] == "valid-skill"
+
+
+class TestListSkillsCache:
+    """Test that list_skills reuses scans until the directory changes."""
+
+    def _write_skill(self, skills_dir: Path, name: str, description: str) -> None:
+        skill_dir = skills_dir / name
+        skill_dir.mkdir(exist_ok=True)
+        (skill_dir / "SKILL.md").write_text(f"""---
+name: {name}
+description: {description}
+---
+Content
+""")
+
+    def test_unchanged_directory_reuses_scan(self, tmp_path: Path) -> None:
+        """Edits inside an existing SKILL.md are not seen until the cache is invalidated."""
+        user_dir = tmp_path / "user_skills"
+        user_dir.mkdir()
+        self._write_skill(user_dir, "cached-skill", "Original")
+
+        skills = list_skills(user_skills_dir=user_dir, project_skills_dir=None)
+        assert skills[0]["description"] == "Original"
+
+        self._write_skill(user_dir, "cached-skill", "Updated")
+        skills = list_skills(user_skills_dir=user_dir, project_skills_dir=None)
+        assert skills[0]["description"] == "Original"
+
+        invalidate_skills_cache()
+        skills = list_skills(user_skills_dir=user_dir, project_skills_dir=None)
+        assert skills[0]["description"] == "Updated"
+
+    def test_cached_results_are_independent_lists(self, tmp_path: Path) -> None:
+        """Mutating a returned list does not affect later calls."""
+        user_dir = tmp_path / "user_skills"
+        user_dir.mkdir()
+        self._write_skill(user_dir, "some-skill", "A skill")
+
+        first = list_skills(user_skills_dir=user_dir, project_skills_dir=None)
+        first.clear()
+        second = list_skills(user_skills_dir=user_dir, project_skills_dir=None)
+        assert len(second) == 1
@@ -0,0 +1,93 @@
+import difflib
+
+import pytest
+
+from deepagents_cli.widgets.tool_renderers import (
+    _DEFAULT_RENDERER,
+    _RENDERER_REGISTRY,
+    EditFileRenderer,
+    get_renderer,
+)
+
+
+def test_get_renderer_returns_shared_instances() -> None:
+    assert get_renderer("edit_file") is _RENDERER_REGISTRY["edit_file"]
+    assert get_renderer("edit_file") is get_renderer("edit_file")
+    assert get_renderer("unknown_tool") is _DEFAULT_RENDERER
+
+
+def test_edit_diff_keeps_line_numbers_after_trimming() -> None:
+    old_lines = [f"line {i}" for i in range(1, 21)]
+    new_lines = list(old_lines)
+    new_lines[9] = "changed"
+
+    diff = EditFileRenderer()._generate_diff("\n".join(old_lines), "\n".join(new_lines))
+
+    assert diff == [
+        "@@ -7,7 +7,7 @@",
+        " line 7",
+        " line 8",
+        " line 9",
+        "-line 10",
+        "+changed",
+        " line 11",
+        " line 12",
+        " line 13",
+    ]
+
+
+def _edit(lines: list[str], changes: dict[int, list[str]]) -> list[str]:
+    """Replace each 0-based line index in `changes` with the given lines."""
+    edited: list[str] = []
+    for i, line in enumerate(lines):
+        edited.extend(changes.get(i, [line]))
+    return edited
+
+
+_FILE = [f"line {i}" for i in range(1, 31)]
+
+
+@pytest.mark.parametrize(
+    ("old_lines", "new_lines"),
+    [
+        # Change near the top: nothing to trim before the hunk
+        (_FILE, _edit(_FILE, {1: ["changed"]})),
+        # Change in the middle with a different line count: head and tail trimmed
+        (_FILE, _edit(_FILE, {14: ["changed", "added"]})),
+        # Two separate hunks between trimmed head and tail
+        (_FILE, _edit(_FILE, {8: ["first"], 20: []})),
+    ],
+    ids=["top", "head-and-tail", "two-hunks"],
+)
+def test_edit_diff_matches_untrimmed_diff(old_lines: list[str], new_lines: list[str]) -> None:
+    expected = list(difflib.unified_diff(old_lines, new_lines, lineterm="", n=3))[2:]
+
+    diff = EditFileRenderer()._generate_diff("\n".join(old_lines), "\n".join(new_lines))
+
+    assert diff == expected
+
+
+@pytest.mark.parametrize(
+    ("old_lines", "new_lines", "expected"),
+    [
+        # A single inserted line among repeated lines stays a single "+" line
+        (
+            ["a", "a", "a", "a", "b"],
+            ["a", "b", "a", "a", "a", "b"],
+            ["@@ -1,4 +1,5 @@", " a", "+b", " a", " a", " a"],
+        ),
+        # Repeated context on both sides is trimmed to three lines each
+        (
+            ["x"] * 12,
+            ["x"] * 6 + ["y"] + ["x"] * 6,
+            ["@@ -4,6 +4,7 @@", " x", " x", " x", "+y", " x", " x", " x"],
+        ),
+    ],
+    ids=["insert-between-repeats", "all-lines-equal"],
+)
+def test_edit_diff_with_repeated_lines(
+    old_lines: list[str], new_lines: list[str], expected: list[str]
+) -> None:
+    diff = EditFileRenderer()._generate_diff("\n".join(old_lines), "\n".join(new_lines))
+
+    assert diff == expected
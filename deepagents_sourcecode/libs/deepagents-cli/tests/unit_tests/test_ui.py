@@ -0,0 +1,31 @@
+"""Tests for CLI display helpers in deepagents_cli.ui."""
+
+import pytest
+from rich.console import Console
+
+from deepagents_cli import ui
+from deepagents_cli.config import COLORS
+
+
+@pytest.mark.parametrize("highlight", [True, False])
+def test_help_lines_render_like_styled_prints(
+    monkeypatch: pytest.MonkeyPatch, *, highlight: bool
+) -> None:
+    """Help lines keep their base style and the console's highlighting."""
+    console = Console(force_terminal=True, color_system="truecolor", highlight=highlight)
+    monkeypatch.setattr(ui, "console", console)
+    ui._help_text.cache_clear()
+
+    with console.capture() as capture:
+        console.print(
+            "  @filename       Auto-complete files and inject content", style=COLORS["dim"]
+        )
+        console.print(
+            "  /command        Slash commands (/help, /clear, /quit)", style=COLORS["dim"]
+        )
+    expected = capture.get()
+    with console.capture() as capture:
+        ui.show_help()
+    ui._help_text.cache_clear()
+
+    assert expected in capture.get()
@@ -1,10 +1,43 @@
-"""플러그인 가능한 파일 저장을 위한 메모리 백엔드입니다."""
+"""플러그인 가능한 파일 저장을 위한 메모리 백엔드입니다.
+
+Backends are imported lazily on first attribute access (PEP 562), so importing
+this package for one backend does not load the others.
+"""
+
+import importlib
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from deepagents.backends.composite import CompositeBackend
+    from deepagents.backends.filesystem import FilesystemBackend
+    from deepagents.backends.protocol import BackendProtocol
+    from deepagents.backends.state import StateBackend
+    from deepagents.backends.store import StoreBackend
+
+# 공개 이름 → 정의된 모듈
+_LAZY_IMPORTS = {
+    "BackendProtocol": "deepagents.backends.protocol",
+    "CompositeBackend": "deepagents.backends.composite",
+    "FilesystemBackend": "deepagents.backends.filesystem",
+    "StateBackend": "deepagents.backends.state",
+    "StoreBackend": "deepagents.backends.store",
+}
+
+
+def __getattr__(name: str) -> object:
+    module_name = _LAZY_IMPORTS.get(name)
+    if module_name is None:
+        msg = f"module {__name__!r} has no attribute {name!r}"
+        raise AttributeError(msg)
+    value = getattr(importlib.import_module(module_name), name)
+    # 다음 접근부터는 일반 모듈 속성으로 조회되도록 캐시
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted([*globals(), *_LAZY_IMPORTS])
 
-from deepagents.backends.composite import CompositeBackend
-from deepagents.backends.filesystem import FilesystemBackend
-from deepagents.backends.protocol import BackendProtocol
-from deepagents.backends.state import StateBackend
-from deepagents.backends.store import StoreBackend
 
 __all__ = [
     "BackendProtocol",
@@ -21,7 +21,11 @@
     ```
 """
 
-from collections import defaultdict
+import asyncio
+from collections import OrderedDict
+from contextlib import suppress
+from operator import itemgetter
+from typing import Any, Generic, TypeVar
 
 from deepagents.backends.protocol import (
     BackendProtocol,
@@ -36,6 +40,97 @@ from deepagents.backends.protocol import (
 )
 from deepagents.backends.state import StateBackend
 
+# route별로 고정인 값: (route_prefix, route_prefix[:-1], len(route_prefix), backend)
+# route_prefix[:-1]은 routed 백엔드가 돌려준 경로 앞에 붙여 원래 경로를 복원할 때 사용합니다.
+_RouteMeta = tuple[str, str, int, BackendProtocol]
+
+# ls/glob 결과 정렬 키(모든 FileInfo는 path를 가짐)
+_PATH_KEY = itemgetter("path")
+
+# `_get_backend_and_key` 결과 캐시의 최대 항목 수(넘치면 가장 오래 쓰지 않은 항목부터 제거)
+_RESOLVE_CACHE_SIZE = 1024
+
+# `_RouteTrie`에 저장하는 값의 타입
+_V = TypeVar("_V")
+
+
+class _RadixNode(Generic[_V]):
+    """`_RouteTrie`의 노드입니다. `label`은 부모에서 이 노드로 오는 edge 문자열입니다."""
+
+    __slots__ = ("children", "label", "rank", "value")
+
+    def __init__(self, label: str) -> None:
+        self.label = label
+        # edge 첫 글자 → 자식 노드(형제 edge는 첫 글자가 모두 다름)
+        self.children: dict[str, _RadixNode[_V]] = {}
+        # 이 노드에서 끝나는 prefix의 값과 rank(값이 없으면 None, rank는 사용하지 않음)
+        self.value: _V | None = None
+        self.rank = 0
+
+
+class _RouteTrie(Generic[_V]):
+    """route prefix를 담는 radix(Patricia) trie입니다.
+
+    갈라지지 않는 구간은 한 edge로 압축되어, 조회는 문자 단위가 아니라 edge 단위로
+    `str.startswith` 한 번씩 비교하며 내려갑니다. 각 prefix는 값과 함께 rank를 가지며,
+    rank는 `sorted_routes`에서의 순서입니다.
+    """
+
+    __slots__ = ("_root",)
+
+    def __init__(self) -> None:
+        self._root: _RadixNode[_V] = _RadixNode("")
+
+    def insert(self, prefix: str, rank: int, value: _V) -> None:
+        """prefix를 추가합니다. 같은 prefix가 이미 있으면 먼저 넣은 값을 유지합니다."""
+        node = self._root
+        i = 0
+        while i < len(prefix):
+            child = node.children.get(prefix[i])
+            if child is None:
+                leaf: _RadixNode[_V] = _RadixNode(prefix[i:])
+                leaf.value = value
+                leaf.rank = rank
+                node.children[prefix[i]] = leaf
+                return
+            label = child.label
+            common = 0
+            limit = min(len(label), len(prefix) - i)
+            while common < limit and label[common] == prefix[i + common]:
+                common += 1
+            if common < len(label):
+                # edge 중간에서 갈라지면 공통 부분까지를 새 노드로 분리
+                split: _RadixNode[_V] = _RadixNode(label[:common])
+                child.label = label[common:]
+                split.children[child.label[0]] = child
+                node.children[prefix[i]] = split
+                child = split
+            node = child
+            i += common
+        if node.value is None:
+            node.value = value
+            node.rank = rank
+
+    def match(self, path: str) -> _V | None:
+        """`path`의 prefix로 등록된 값 중 rank가 가장 앞선 것을 반환합니다(없으면 None).
+
+        `sorted_routes`를 앞에서부터 훑어 처음 매칭되는 route를 고르는 것과 같은 결과입니다.
+        """
+        node = self._root
+        match = node.value
+        match_rank = node.rank
+        i = 0
+        while i < len(path):
+            child = node.children.get(path[i])
+            if child is None or not path.startswith(child.label, i):
+                break
+            node = child
+            i += len(child.label)
+            if node.value is not None and (match is None or node.rank < match_rank):
+                match = node.value
+                match_rank = node.rank
+        return match
+
 
 class CompositeBackend(BackendProtocol):
     """경로 prefix에 따라 파일 작업을 서로 다른 백엔드로 위임합니다.
@@ -75,12 +170,40 @@ class CompositeBackend(BackendProtocol):
         # 기본(default) 백엔드
         self.default = default
 
+        # default가 state를 갖는 경우(예: StateBackend) 쓰기 결과를 병합할 runtime.
+        # default는 생성 후 바뀌지 않으므로 매 write/edit마다 getattr하지 않도록 한 번만 조회
+        self._default_runtime = getattr(default, "runtime", None)
+        # execute/aexecute가 위임할 백엔드(default가 실행을 지원하지 않으면 None)
+        self._exec_backend = default if isinstance(default, SandboxBackendProtocol) else None
+
         # 가상(virtual) route 설정
         self.routes = routes
 
         # prefix 매칭이 올바르게 동작하도록 길이 기준(내림차순)으로 정렬
         self.sorted_routes = sorted(routes.items(), key=lambda x: len(x[0]), reverse=True)
 
+        # route별 고정 메타데이터를 한 번만 계산(루트 grep/glob은 routes 순서대로 훑음)
+        self._route_meta: list[_RouteMeta] = [(prefix, prefix[:-1], len(prefix), backend) for prefix, backend in routes.items()]
+        # 루트 ls에서 route 자체를 나타내는 디렉토리 항목(예: /memories/)
+        self._route_markers: list[FileInfo] = [{"path": prefix, "is_dir": True, "size": 0, "modified_at": ""} for prefix, _ in self.sorted_routes]
+
+        # route는 생성 후 바뀌지 않으므로 매 호출마다 routes를 훑는 대신 trie를 한 번만 구성
+        # - 파일 경로: route prefix 전체로 매칭, 값은 (backend, prefix 길이)
+        # - 디렉토리 조회(ls/grep/glob): 끝의 `/`를 뗀 prefix로 매칭, 값은 route 메타데이터
+        # rank는 sorted_routes와 같은 순서(길이 내림차순, 같은 길이는 routes 순서)입니다.
+        self._has_routes = bool(routes)
+        self._route_trie: _RouteTrie[tuple[BackendProtocol, int]] = _RouteTrie()
+        self._dir_route_trie: _RouteTrie[_RouteMeta] = _RouteTrie()
+        sorted_meta = sorted(self._route_meta, key=lambda meta: meta[2], reverse=True)
+        for rank, meta in enumerate(sorted_meta):
+            prefix, _, prefix_len, backend = meta
+            self._route_trie.insert(prefix, rank, (backend, prefix_len))
+            self._dir_route_trie.insert(prefix.rstrip("/"), rank, meta)
+
+        # 경로 → (backend, stripped_key) 캐시. routes가 바뀌지 않으므로 무효화가 필요 없고,
+        # 같은 파일을 반복해서 읽고/편집하는 경우 trie 탐색과 문자열 조합을 건너뜁니다.
+        self._resolve_cache: OrderedDict[str, tuple[BackendProtocol, str]] = OrderedDict()
+
     def _get_backend_and_key(self, key: str) -> tuple[BackendProtocol, str]:
         """경로에 맞는 백엔드를 찾고 route prefix를 제거한 경로를 반환합니다.
 
@@ -91,16 +214,56 @@ class CompositeBackend(BackendProtocol):
             `(backend, stripped_path)` 튜플. `stripped_path`는 route prefix를 제거하되
             선행 `/`는 유지합니다.
         """
-        # route prefix 길이가 긴 것부터 확인(가장 구체적인 route 우선)
-        for prefix, backend in self.sorted_routes:
-            if key.startswith(prefix):
-                # prefix를 제거하되, 선행 슬래시를 유지
-                # 예: "/memories/notes.txt" → "/notes.txt", "/memories/" → "/"
-                suffix = key[len(prefix) :]
-                stripped_key = f"/{suffix}" if suffix else "/"
-                return backend, stripped_key
-
-        return self.default, key
+        if not self._has_routes:
+            return self.default, key
+
+        cache = self._resolve_cache
+        resolved = cache.get(key)
+        if resolved is not None:
+            # 동기 호출이 여러 스레드에서 올 수 있으므로, 그 사이 제거된 경우는 무시
+            with suppress(KeyError):
+                cache.move_to_end(key)
+            return resolved
+
+        # trie에서 가장 긴(가장 구체적인) route prefix를 찾음
+        match = self._route_trie.match(key)
+        if match is None:
+            resolved = (self.default, key)
+        else:
+            # prefix를 제거하되, 선행 슬래시를 유지
+            # 예: "/memories/notes.txt" → "/notes.txt", "/memories/" → "/"
+            backend, prefix_len = match
+            suffix = key[prefix_len:]
+            resolved = (backend, "/" + suffix if suffix else "/")
+
+        cache[key] = resolved
+        if len(cache) > _RESOLVE_CACHE_SIZE:
+            cache.popitem(last=False)
+        return resolved
+
+    def _merge_state(self, files_update: dict[str, Any]) -> None:
+        """Routed 백엔드의 `files_update`를 default state에도 병합합니다.
+
+        listing이 변경을 반영하도록 default가 state를 갖는 경우에만 병합합니다.
+        """
+        runtime = self._default_runtime
+        if runtime is None:
+            return
+        state = runtime.state
+        files = state.get("files")
+        if files is None:
+            files = state["files"] = {}
+        files.update(files_update)
+
+    def _match_dir_route(self, path: str) -> _RouteMeta | None:
+        """디렉토리 조회 경로에 매칭되는 route의 메타데이터를 반환합니다.
+
+        `path`가 끝의 `/`를 뗀 route prefix로 시작하면 매칭으로 봅니다
+        (예: `/memories`와 `/memories/sub` 모두 `/memories/` route에 매칭).
+        """
+        if not self._has_routes:
+            return None
+        return self._dir_route_trie.match(path)
 
     def ls_info(self, path: str) -> list[FileInfo]:
         """디렉토리 내용을 나열합니다(비재귀).
@@ -123,35 +286,23 @@ class CompositeBackend(BackendProtocol):
             ```
         """
         # path가 특정 route에 매칭되는지 확인
-        for route_prefix, backend in self.sorted_routes:
-            if path.startswith(route_prefix.rstrip("/")):
-                # 매칭된 routed backend만 조회
-                suffix = path[len(route_prefix) :]
-                search_path = f"/{suffix}" if suffix else "/"
-                infos = backend.ls_info(search_path)
-                prefixed: list[FileInfo] = []
-                for fi in infos:
-                    fi = dict(fi)
-                    fi["path"] = f"{route_prefix[:-1]}{fi['path']}"
-                    prefixed.append(fi)
-                return prefixed
+        route = self._match_dir_route(path)
+        if route is not None:
+            # 매칭된 routed backend만 조회
+            _, route_body, prefix_len, backend = route
+            suffix = path[prefix_len:]
+            search_path = "/" + suffix if suffix else "/"
+            infos = backend.ls_info(search_path)
+            return [{**fi, "path": route_body + fi["path"]} for fi in infos]
 
         # 루트에서는 default + 모든 route 디렉토리를 합산
         if path == "/":
             results: list[FileInfo] = []
             results.extend(self.default.ls_info(path))
-            for route_prefix, backend in self.sorted_routes:
-                # route 자체를 디렉토리로 추가(예: /memories/)
-                results.append(
-                    {
-                        "path": route_prefix,
-                        "is_dir": True,
-                        "size": 0,
-                        "modified_at": "",
-                    }
-                )
-
-            results.sort(key=lambda x: x.get("path", ""))
+            # route 자체를 디렉토리로 추가(예: /memories/). 호출자가 수정해도 되도록 복사본을 반환
+            results.extend([marker.copy() for marker in self._route_markers])
+
+            results.sort(key=_PATH_KEY)
             return results
 
         # 어떤 route에도 매칭되지 않으면 default backend만 조회
@@ -160,35 +311,23 @@ class CompositeBackend(BackendProtocol):
     async def als_info(self, path: str) -> list[FileInfo]:
         """`ls_info`의 async 버전입니다."""
         # path가 특정 route에 매칭되는지 확인
-        for route_prefix, backend in self.sorted_routes:
-            if path.startswith(route_prefix.rstrip("/")):
-                # 매칭된 routed backend만 조회
-                suffix = path[len(route_prefix) :]
-                search_path = f"/{suffix}" if suffix else "/"
-                infos = await backend.als_info(search_path)
-                prefixed: list[FileInfo] = []
-                for fi in infos:
-                    fi = dict(fi)
-                    fi["path"] = f"{route_prefix[:-1]}{fi['path']}"
-                    prefixed.append(fi)
-                return prefixed
+        route = self._match_dir_route(path)
+        if route is not None:
+            # 매칭된 routed backend만 조회
+            _, route_body, prefix_len, backend = route
+            suffix = path[prefix_len:]
+            search_path = "/" + suffix if suffix else "/"
+            infos = await backend.als_info(search_path)
+            return [{**fi, "path": route_body + fi["path"]} for fi in infos]
 
         # 루트에서는 default + 모든 route 디렉토리를 합산
         if path == "/":
             results: list[FileInfo] = []
             results.extend(await self.default.als_info(path))
-            for route_prefix, backend in self.sorted_routes:
-                # route 자체를 디렉토리로 추가(예: /memories/)
-                results.append(
-                    {
-                        "path": route_prefix,
-                        "is_dir": True,
-                        "size": 0,
-                        "modified_at": "",
-                    }
-                )
-
-            results.sort(key=lambda x: x.get("path", ""))
+            # route 자체를 디렉토리로 추가(예: /memories/). 호출자가 수정해도 되도록 복사본을 반환
+            results.extend([marker.copy() for marker in self._route_markers])
+
+            results.sort(key=_PATH_KEY)
             return results
 
         # 어떤 route에도 매칭되지 않으면 default backend만 조회
@@ -254,13 +393,13 @@ class CompositeBackend(BackendProtocol):
             ```
         """
         # path가 특정 route를 가리키면 해당 백엔드만 검색
-        for route_prefix, backend in self.sorted_routes:
-            if path is not None and path.startswith(route_prefix.rstrip("/")):
-                search_path = path[len(route_prefix) - 1 :]
-                raw = backend.grep_raw(pattern, search_path if search_path else "/", glob)
-                if isinstance(raw, str):
-                    return raw
-                return [{**m, "path": f"{route_prefix[:-1]}{m['path']}"} for m in raw]
+        if path is not None and (route := self._match_dir_route(path)) is not None:
+            _, route_body, prefix_len, backend = route
+            search_path = path[prefix_len - 1 :] or "/"
+            raw = backend.grep_raw(pattern, search_path, glob)
+            if isinstance(raw, str):
+                return raw
+            return [{**m, "path": route_body + m["path"]} for m in raw]
 
         # path가 None 또는 "/"이면 default + 모든 route 백엔드를 검색하여 병합
         # 그 외에는 default 백엔드만 검색
@@ -272,12 +411,12 @@ class CompositeBackend(BackendProtocol):
                 return raw_default
             all_matches.extend(raw_default)
 
-            for route_prefix, backend in self.routes.items():
+            for _, route_body, _, backend in self._route_meta:
                 raw = backend.grep_raw(pattern, "/", glob)
                 if isinstance(raw, str):
                     # 에러가 발생하면 문자열 오류 메시지가 반환됩니다.
                     return raw
-                all_matches.extend({**m, "path": f"{route_prefix[:-1]}{m['path']}"} for m in raw)
+                all_matches.extend([{**m, "path": route_body + m["path"]} for m in raw])
 
             return all_matches
         # Path specified but doesn't match a route - search only default
@@ -294,30 +433,33 @@ class CompositeBackend(BackendProtocol):
         라우팅 동작과 파라미터에 대한 자세한 설명은 `grep_raw()`를 참고하세요.
         """
         # path가 특정 route를 가리키면 해당 백엔드만 검색
-        for route_prefix, backend in self.sorted_routes:
-            if path is not None and path.startswith(route_prefix.rstrip("/")):
-                search_path = path[len(route_prefix) - 1 :]
-                raw = await backend.agrep_raw(pattern, search_path if search_path else "/", glob)
-                if isinstance(raw, str):
-                    return raw
-                return [{**m, "path": f"{route_prefix[:-1]}{m['path']}"} for m in raw]
+        if path is not None and (route := self._match_dir_route(path)) is not None:
+            _, route_body, prefix_len, backend = route
+            search_path = path[prefix_len - 1 :] or "/"
+            raw = await backend.agrep_raw(pattern, search_path, glob)
+            if isinstance(raw, str):
+                return raw
+            return [{**m, "path": route_body + m["path"]} for m in raw]
 
         # path가 None 또는 "/"이면 default + 모든 route 백엔드를 검색하여 병합
         # 그 외에는 default 백엔드만 검색
         if path is None or path == "/":
             all_matches: list[GrepMatch] = []
-            raw_default = await self.default.agrep_raw(pattern, path, glob)  # type: ignore[attr-defined]
+            # 백엔드끼리는 독립적이므로 동시에 검색(지연 시간 = 가장 느린 백엔드)
+            raw_default, *raw_routes = await asyncio.gather(
+                self.default.agrep_raw(pattern, path, glob),  # type: ignore[attr-defined]
+                *(backend.agrep_raw(pattern, "/", glob) for _, _, _, backend in self._route_meta),
+            )
             if isinstance(raw_default, str):
                 # 에러가 발생하면 문자열 오류 메시지가 반환됩니다.
                 return raw_default
             all_matches.extend(raw_default)
 
-            for route_prefix, backend in self.routes.items():
-                raw = await backend.agrep_raw(pattern, "/", glob)
+            for (_, route_body, _, _), raw in zip(self._route_meta, raw_routes, strict=True):
                 if isinstance(raw, str):
                     # 에러가 발생하면 문자열 오류 메시지가 반환됩니다.
                     return raw
-                all_matches.extend({**m, "path": f"{route_prefix[:-1]}{m['path']}"} for m in raw)
+                all_matches.extend([{**m, "path": route_body + m["path"]} for m in raw])
 
             return all_matches
         # Path specified but doesn't match a route - search only default
@@ -327,21 +469,22 @@ class CompositeBackend(BackendProtocol):
         results: list[FileInfo] = []
 
         # Route based on path, not pattern
-        for route_prefix, backend in self.sorted_routes:
-            if path.startswith(route_prefix.rstrip("/")):
-                search_path = path[len(route_prefix) - 1 :]
-                infos = backend.glob_info(pattern, search_path if search_path else "/")
-                return [{**fi, "path": f"{route_prefix[:-1]}{fi['path']}"} for fi in infos]
+        route = self._match_dir_route(path)
+        if route is not None:
+            _, route_body, prefix_len, backend = route
+            search_path = path[prefix_len - 1 :] or "/"
+            infos = backend.glob_info(pattern, search_path)
+            return [{**fi, "path": route_body + fi["path"]} for fi in infos]
 
         # Path doesn't match any specific route - search default backend AND all routed backends
         results.extend(self.default.glob_info(pattern, path))
 
-        for route_prefix, backend in self.routes.items():
+        for _, route_body, _, backend in self._route_meta:
             infos = backend.glob_info(pattern, "/")
-            results.extend({**fi, "path": f"{route_prefix[:-1]}{fi['path']}"} for fi in infos)
+            results.extend([{**fi, "path": route_body + fi["path"]} for fi in infos])
 
         # Deterministic ordering
-        results.sort(key=lambda x: x.get("path", ""))
+        results.sort(key=_PATH_KEY)
         return results
 
     async def aglob_info(self, pattern: str, path: str = "/") -> list[FileInfo]:
@@ -349,21 +492,25 @@ class CompositeBackend(BackendProtocol):
         results: list[FileInfo] = []
 
         # pattern이 아니라 path 기준으로 라우팅
-        for route_prefix, backend in self.sorted_routes:
-            if path.startswith(route_prefix.rstrip("/")):
-                search_path = path[len(route_prefix) - 1 :]
-                infos = await backend.aglob_info(pattern, search_path if search_path else "/")
-                return [{**fi, "path": f"{route_prefix[:-1]}{fi['path']}"} for fi in infos]
-
-        # 어떤 route에도 매칭되지 않으면 default + 모든 route 백엔드를 검색
-        results.extend(await self.default.aglob_info(pattern, path))
+        route = self._match_dir_route(path)
+        if route is not None:
+            _, route_body, prefix_len, backend = route
+            search_path = path[prefix_len - 1 :] or "/"
+            infos = await backend.aglob_info(pattern, search_path)
+            return [{**fi, "path": route_body + fi["path"]} for fi in infos]
+
+        # 어떤 route에도 매칭되지 않으면 default + 모든 route 백엔드를 동시에 검색
+        default_infos, *route_infos = await asyncio.gather(
+            self.default.aglob_info(pattern, path),
+            *(backend.aglob_info(pattern, "/") for _, _, _, backend in self._route_meta),
+        )
+        results.extend(default_infos)
 
-        for route_prefix, backend in self.routes.items():
-            infos = await backend.aglob_info(pattern, "/")
-            results.extend({**fi, "path": f"{route_prefix[:-1]}{fi['path']}"} for fi in infos)
+        for (_, route_body, _, _), infos in zip(self._route_meta, route_infos, strict=True):
+            results.extend([{**fi, "path": route_body + fi["path"]} for fi in infos])
 
         # deterministic ordering
-        results.sort(key=lambda x: x.get("path", ""))
+        results.sort(key=_PATH_KEY)
         return results
 
     def write(
@@ -385,15 +532,7 @@ class CompositeBackend(BackendProtocol):
         # state-backed 업데이트(그리고 default가 state를 갖는 경우)면,
         # listing이 변경을 반영하도록 default state에도 병합합니다.
         if res.files_update:
-            try:
-                runtime = getattr(self.default, "runtime", None)
-                if runtime is not None:
-                    state = runtime.state
-                    files = state.get("files", {})
-                    files.update(res.files_update)
-                    state["files"] = files
-            except Exception:
-                pass
+            self._merge_state(res.files_update)
         return res
 
     async def awrite(
@@ -407,15 +546,7 @@ class CompositeBackend(BackendProtocol):
         # state-backed 업데이트(그리고 default가 state를 갖는 경우)면,
         # listing이 변경을 반영하도록 default state에도 병합합니다.
         if res.files_update:
-            try:
-                runtime = getattr(self.default, "runtime", None)
-                if runtime is not None:
-                    state = runtime.state
-                    files = state.get("files", {})
-                    files.update(res.files_update)
-                    state["files"] = files
-            except Exception:
-                pass
+            self._merge_state(res.files_update)
         return res
 
     def edit(
@@ -439,15 +570,7 @@ class CompositeBackend(BackendProtocol):
         backend, stripped_key = self._get_backend_and_key(file_path)
         res = backend.edit(stripped_key, old_string, new_string, replace_all=replace_all)
         if res.files_update:
-            try:
-                runtime = getattr(self.default, "runtime", None)
-                if runtime is not None:
-                    state = runtime.state
-                    files = state.get("files", {})
-                    files.update(res.files_update)
-                    state["files"] = files
-            except Exception:
-                pass
+            self._merge_state(res.files_update)
         return res
 
     async def aedit(
@@ -461,15 +584,7 @@ class CompositeBackend(BackendProtocol):
         backend, stripped_key = self._get_backend_and_key(file_path)
         res = await backend.aedit(stripped_key, old_string, new_string, replace_all=replace_all)
         if res.files_update:
-            try:
-                runtime = getattr(self.default, "runtime", None)
-                if runtime is not None:
-                    state = runtime.state
-                    files = state.get("files", {})
-                    files.update(res.files_update)
-                    state["files"] = files
-            except Exception:
-                pass
+            self._merge_state(res.files_update)
         return res
 
     def execute(
@@ -494,8 +609,9 @@ class CompositeBackend(BackendProtocol):
             result = composite.execute("ls -la")
             ```
         """
-        if isinstance(self.default, SandboxBackendProtocol):
-            return self.default.execute(command)
+        exec_backend = self._exec_backend
+        if exec_backend is not None:
+            return exec_backend.execute(command)
 
         # execute 도구의 런타임 체크가 제대로 동작한다면 여기에 도달하지 않아야 하지만,
         # 안전장치(fallback)로 예외를 둡니다.
@@ -509,8 +625,9 @@ class CompositeBackend(BackendProtocol):
         command: str,
     ) -> ExecuteResponse:
         """`execute`의 async 버전입니다."""
-        if isinstance(self.default, SandboxBackendProtocol):
-            return await self.default.aexecute(command)
+        exec_backend = self._exec_backend
+        if exec_backend is not None:
+            return await exec_backend.aexecute(command)
 
         # execute 도구의 런타임 체크가 제대로 동작한다면 여기에 도달하지 않아야 하지만,
         # 안전장치(fallback)로 예외를 둡니다.
@@ -532,63 +649,79 @@ class CompositeBackend(BackendProtocol):
             List of FileUploadResponse objects, one per input file.
             Response order matches input order.
         """
+        # route가 없으면 모든 파일이 default로 가므로 그룹화 없이 그대로 넘기고 응답만 감쌈
+        if not self._has_routes and files:
+            responses = self.default.upload_files(files)
+            wrapped = [FileUploadResponse(path=path, error=response.error) for (path, _), response in zip(files, responses, strict=False)]
+            wrapped.extend([FileUploadResponse(path=path, error=None) for path, _ in files[len(responses) :]])
+            return wrapped
+
         # 결과 리스트를 미리 할당
         results: list[FileUploadResponse | None] = [None] * len(files)
 
         # 원래 인덱스를 유지하면서 백엔드별로 파일을 그룹화
-        from collections import defaultdict
-
-        backend_batches: dict[BackendProtocol, list[tuple[int, str, bytes]]] = defaultdict(list)
+        # 백엔드별로 (원래 인덱스 목록, 백엔드에 넘길 (경로, 내용) 목록)을 나란히 쌓아
+        # 나중에 다시 분해/재조합하지 않고 그대로 백엔드에 넘깁니다.
+        backend_batches: dict[BackendProtocol, tuple[list[int], list[tuple[str, bytes]]]] = {}
 
         for idx, (path, content) in enumerate(files):
             backend, stripped_path = self._get_backend_and_key(path)
-            backend_batches[backend].append((idx, stripped_path, content))
+            batch = backend_batches.get(backend)
+            if batch is None:
+                batch = backend_batches[backend] = ([], [])
+            batch[0].append(idx)
+            batch[1].append((stripped_path, content))
 
         # 백엔드별 배치를 처리
-        for backend, batch in backend_batches.items():
-            # 백엔드 호출에 필요한 데이터로 분해
-            indices, stripped_paths, contents = zip(*batch, strict=False)
-            batch_files = list(zip(stripped_paths, contents, strict=False))
-
+        for backend, (indices, batch_files) in backend_batches.items():
             # 해당 백엔드로 1회 호출(배치)
             batch_responses = backend.upload_files(batch_files)
 
             # 원래 경로/인덱스 위치에 응답을 채웁니다.
-            for i, orig_idx in enumerate(indices):
-                results[orig_idx] = FileUploadResponse(
-                    path=files[orig_idx][0],  # Original path
-                    error=batch_responses[i].error if i < len(batch_responses) else None,
-                )
+            for orig_idx, response in zip(indices, batch_responses, strict=False):
+                results[orig_idx] = FileUploadResponse(path=files[orig_idx][0], error=response.error)
+            # 백엔드가 응답을 덜 돌려준 나머지 파일은 오류 없음으로 채움
+            for orig_idx in indices[len(batch_responses) :]:
+                results[orig_idx] = FileUploadResponse(path=files[orig_idx][0], error=None)
 
         return results  # type: ignore[return-value]
 
     async def aupload_files(self, files: list[tuple[str, bytes]]) -> list[FileUploadResponse]:
         """`upload_files`의 async 버전입니다."""
+        # route가 없으면 모든 파일이 default로 가므로 그룹화 없이 그대로 넘기고 응답만 감쌈
+        if not self._has_routes and files:
+            responses = await self.default.aupload_files(files)
+            wrapped = [FileUploadResponse(path=path, error=response.error) for (path, _), response in zip(files, responses, strict=False)]
+            wrapped.extend([FileUploadResponse(path=path, error=None) for path, _ in files[len(responses) :]])
+            return wrapped
+
         # 결과 리스트를 미리 할당
         results: list[FileUploadResponse | None] = [None] * len(files)
 
         # 원래 인덱스를 유지하면서 백엔드별로 파일을 그룹화
-        backend_batches: dict[BackendProtocol, list[tuple[int, str, bytes]]] = defaultdict(list)
+        # 백엔드별로 (원래 인덱스 목록, 백엔드에 넘길 (경로, 내용) 목록)을 나란히 쌓아
+        # 나중에 다시 분해/재조합하지 않고 그대로 백엔드에 넘깁니다.
+        backend_batches: dict[BackendProtocol, tuple[list[int], list[tuple[str, bytes]]]] = {}
 
         for idx, (path, content) in enumerate(files):
             backend, stripped_path = self._get_backend_and_key(path)
-            backend_batches[backend].append((idx, stripped_path, content))
+            batch = backend_batches.get(backend)
+            if batch is None:
+                batch = backend_batches[backend] = ([], [])
+            batch[0].append(idx)
+            batch[1].append((stripped_path, content))
 
-        # 백엔드별 배치를 처리
-        for backend, batch in backend_batches.items():
-            # 백엔드 호출에 필요한 데이터로 분해
-            indices, stripped_paths, contents = zip(*batch, strict=False)
-            batch_files = list(zip(stripped_paths, contents, strict=False))
-
-            # 해당 백엔드로 1회 호출(배치)
-            batch_responses = await backend.aupload_files(batch_files)
+        # 백엔드별로 1회씩(배치) 동시에 호출
+        all_responses = await asyncio.gather(*(backend.aupload_files(batch_files) for backend, (_, batch_files) in backend_batches.items()))
 
+        # 백엔드별 배치를 처리
+        for (indices, _), batch_responses in zip(backend_batches.values(), all_responses, strict=True):
             # 원래 경로/인덱스 위치에 응답을 채웁니다.
-            for i, orig_idx in enumerate(indices):
-                results[orig_idx] = FileUploadResponse(
-                    path=files[orig_idx][0],  # Original path
-                    error=batch_responses[i].error if i < len(batch_responses) else None,
-                )
+            for orig_idx, response in zip(indices, batch_responses, strict=False):
+                results[orig_idx] = FileUploadResponse(path=files[orig_idx][0], error=response.error)
+            # 백엔드가 응답을 덜 돌려준 나머지 파일은 오류 없음으로 채움
+            for orig_idx in indices[len(batch_responses) :]:
+                results[orig_idx] = FileUploadResponse(path=files[orig_idx][0], error=None)
 
         return results  # type: ignore[return-value]
 
@@ -605,58 +738,80 @@ class CompositeBackend(BackendProtocol):
             List of FileDownloadResponse objects, one per input path.
             Response order matches input order.
         """
+        # route가 없으면 모든 경로가 default로 가므로 그룹화 없이 그대로 넘기고 응답만 감쌈
+        if not self._has_routes and paths:
+            responses = self.default.download_files(paths)
+            wrapped = [
+                FileDownloadResponse(path=path, content=response.content, error=response.error)
+                for path, response in zip(paths, responses, strict=False)
+            ]
+            wrapped.extend([FileDownloadResponse(path=path, content=None, error=None) for path in paths[len(responses) :]])
+            return wrapped
+
         # 결과 리스트를 미리 할당
         results: list[FileDownloadResponse | None] = [None] * len(paths)
 
-        backend_batches: dict[BackendProtocol, list[tuple[int, str]]] = defaultdict(list)
+        # 백엔드별로 (원래 인덱스 목록, 백엔드에 넘길 경로 목록)을 나란히 쌓음
+        backend_batches: dict[BackendProtocol, tuple[list[int], list[str]]] = {}
 
         for idx, path in enumerate(paths):
             backend, stripped_path = self._get_backend_and_key(path)
-            backend_batches[backend].append((idx, stripped_path))
+            batch = backend_batches.get(backend)
+            if batch is None:
+                batch = backend_batches[backend] = ([], [])
+            batch[0].append(idx)
+            batch[1].append(stripped_path)
 
         # 백엔드별 배치를 처리
-        for backend, batch in backend_batches.items():
-            # 백엔드 호출에 필요한 데이터로 분해
-            indices, stripped_paths = zip(*batch, strict=False)
-
+        for backend, (indices, stripped_paths) in backend_batches.items():
             # 해당 백엔드로 1회 호출(배치)
-            batch_responses = backend.download_files(list(stripped_paths))
+            batch_responses = backend.download_files(stripped_paths)
 
             # 원래 경로/인덱스 위치에 응답을 채웁니다.
-            for i, orig_idx in enumerate(indices):
-                results[orig_idx] = FileDownloadResponse(
-                    path=paths[orig_idx],  # Original path
-                    content=batch_responses[i].content if i < len(batch_responses) else None,
-                    error=batch_responses[i].error if i < len(batch_responses) else None,
-                )
+            for orig_idx, response in zip(indices, batch_responses, strict=False):
+                results[orig_idx] = FileDownloadResponse(path=paths[orig_idx], content=response.content, error=response.error)
+            # 백엔드가 응답을 덜 돌려준 나머지 경로는 내용/오류 없음으로 채움
+            for orig_idx in indices[len(batch_responses) :]:
+                results[orig_idx] = FileDownloadResponse(path=paths[orig_idx], content=None, error=None)
 
         return results  # type: ignore[return-value]
 
     async def adownload_files(self, paths: list[str]) -> list[FileDownloadResponse]:
         """`download_files`의 async 버전입니다."""
+        # route가 없으면 모든 경로가 default로 가므로 그룹화 없이 그대로 넘기고 응답만 감쌈
+        if not self._has_routes and paths:
+            responses = await self.default.adownload_files(paths)
+            wrapped = [
+                FileDownloadResponse(path=path, content=response.content, error=response.error)
+                for path, response in zip(paths, responses, strict=False)
+            ]
+            wrapped.extend([FileDownloadResponse(path=path, content=None, error=None) for path in paths[len(responses) :]])
+            return wrapped
+
         # 결과 리스트를 미리 할당
         results: list[FileDownloadResponse | None] = [None] * len(paths)
 
-        backend_batches: dict[BackendProtocol, list[tuple[int, str]]] = defaultdict(list)
+        # 백엔드별로 (원래 인덱스 목록, 백엔드에 넘길 경로 목록)을 나란히 쌓음
+        backend_batches: dict[BackendProtocol, tuple[list[int], list[str]]] = {}
 
         for idx, path in enumerate(paths):
             backend, stripped_path = self._get_backend_and_key(path)
-            backend_batches[backend].append((idx, stripped_path))
+            batch = backend_batches.get(backend)
+            if batch is None:
+                batch = backend_batches[backend] = ([], [])
+            batch[0].append(idx)
+            batch[1].append(stripped_path)
 
-        # 백엔드별 배치를 처리
-        for backend, batch in backend_batches.items():
-            # 백엔드 호출에 필요한 데이터로 분해
-            indices, stripped_paths = zip(*batch, strict=False)
-
-            # 해당 백엔드로 1회 호출(배치)
-            batch_responses = await backend.adownload_files(list(stripped_paths))
+        # 백엔드별로 1회씩(배치) 동시에 호출
+        all_responses = await asyncio.gather(*(backend.adownload_files(stripped_paths) for backend, (_, stripped_paths) in backend_batches.items()))
 
+        # 백엔드별 배치를 처리
+        for (indices, _), batch_responses in zip(backend_batches.values(), all_responses, strict=True):
             # 원래 경로/인덱스 위치에 응답을 채웁니다.
-            for i, orig_idx in enumerate(indices):
-                results[orig_idx] = FileDownloadResponse(
-                    path=paths[orig_idx],  # Original path
-                    content=batch_responses[i].content if i < len(batch_responses) else None,
-                    error=batch_responses[i].error if i < len(batch_responses) else None,
-                )
+            for orig_idx, response in zip(indices, batch_responses, strict=False):
+                results[orig_idx] = FileDownloadResponse(path=paths[orig_idx], content=response.content, error=response.error)
+            # 백엔드가 응답을 덜 돌려준 나머지 경로는 내용/오류 없음으로 채움
+            for orig_idx in indices[len(batch_responses) :]:
+                results[orig_idx] = FileDownloadResponse(path=paths[orig_idx], content=None, error=None)
 
         return results  # type: ignore[return-value]
@@ -206,6 +206,35 @@ def test_composite_backend_multiple_routes():
     assert "persistent memory" in updated_content
 
 
+def test_composite_backend_nested_routes_use_longest_prefix():
+    """Test that overlapping route prefixes resolve to the most specific route."""
+    rt = make_runtime("t6b")
+    comp = build_composite_state_backend(
+        rt,
+        routes={
+            "/memories/": (lambda r: StoreBackend(r)),
+            "/memories/archive/": (lambda r: StoreBackend(r)),
+            "/mem/": (lambda r: StoreBackend(r)),
+        },
+    )
+
+    backend, key = comp._get_backend_and_key("/memories/archive/old.md")
+    assert backend is comp.routes["/memories/archive/"]
+    assert key == "/old.md"
+
+    backend, key = comp._get_backend_and_key("/memories/archived.md")
+    assert backend is comp.routes["/memories/"]
+    assert key == "/archived.md"
+
+    backend, key = comp._get_backend_and_key("/mem/notes.md")
+    assert backend is comp.routes["/mem/"]
+    assert key == "/notes.md"
+
+    backend, key = comp._get_backend_and_key("/me/notes.md")
+    assert backend is comp.default
+    assert key == "/me/notes.md"
+
+
 def test_composite_backend_grep_path_isolation():
     """Test that grep with path=/tools doesn't return results from /memories."""
     rt = make_runtime("t7")
@@ -8,14 +8,20 @@
 공개 API:
 - SkillsMiddleware: 에이전트 실행에 스킬을 통합하는 미들웨어
 - list_skills: 디렉토리에서 스킬 메타데이터 로드
+- invalidate_skills_cache: 스캔 간 유지되는 스킬 디렉토리 캐시 초기화
 - SkillMetadata: 스킬 메타데이터 구조용 TypedDict
 """
 
-from research_agent.skills.load import SkillMetadata, list_skills
+from research_agent.skills.load import (
+    SkillMetadata,
+    invalidate_skills_cache,
+    list_skills,
+)
 from research_agent.skills.middleware import SkillsMiddleware
 
 __all__ = [
     "SkillsMiddleware",
     "list_skills",
+    "invalidate_skills_cache",
     "SkillMetadata",
 ]
@@ -25,12 +25,14 @@ research_agent 프로젝트용으로 deepagents-cli에서 적응함.
 
 from __future__ import annotations
 
+import functools
 import logging
+import os
 import re
+import stat
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import NotRequired, TypedDict
-
-import yaml
+from typing import Any, NotRequired, TypedDict
 
 logger = logging.getLogger(__name__)
 
@@ -41,6 +43,40 @@ MAX_SKILL_FILE_SIZE = 10 * 1024 * 1024
 MAX_SKILL_NAME_LENGTH = 64
 MAX_SKILL_DESCRIPTION_LENGTH = 1024
 
+# 이보다 많은 SKILL.md가 있으면 스레드 풀로 병렬 파싱
+_PARALLEL_PARSE_THRESHOLD = 8
+_MAX_PARSE_WORKERS = 8
+
+# SKILL.md가 없는 것으로 확인된 스킬 디렉토리 경로 -> 당시 디렉토리 mtime (ns)
+_MISSING_SKILL_MD_CACHE: dict[str, int] = {}
+
+# SKILL.md 경로 -> ((mtime ns, 크기, 출처), 파싱 결과). 파일이 그대로면 재파싱하지 않음
+_METADATA_CACHE: dict[str, tuple[tuple[int, int, str], SkillMetadata | None]] = {}
+
+# 프론트매터 파싱 시 처음 읽는 크기 (설명 최대 길이 + 기타 필드 여유분)
+_FRONTMATTER_READ_SIZE = 4096
+
+# 스킬 이름에 허용되는 문자: 소문자 영숫자와 하이픈
+_SKILL_NAME_CHARS = frozenset("abcdefghijklmnopqrstuvwxyz0123456789-")
+
+# --- 구분자 사이의 YAML 프론트매터
+_FRONTMATTER_RE = re.compile(r"^---\s*\n(.*?)\n---\s*\n", re.DOTALL)
+
+# 평면 프론트매터 빠른 경로용 문자 집합
+_FLAT_KEY_CHARS = frozenset(
+    "abcdefghijklmnopqrstuvwxyzABCDEFGHIJKLMNOPQRSTUVWXYZ0123456789_-"
+)
+# 이 문자로 시작하는 plain 값은 YAML 지시자, 숫자, 특수 스칼라일 수 있음
+_YAML_SPECIAL_STARTS = frozenset("-?:,[]{}#&*!|>'\"%@`<=+.0123456789~")
+# YAML이 bool/null로 해석하는 plain 값 (소문자 비교)
+_YAML_RESERVED_WORDS = frozenset({"yes", "no", "true", "false", "on", "off", "null"})
+# 빠른 경로에서 다루지 않는 문자: 탭/CR, 제어 문자, 유니코드 줄바꿈(U+0085, U+2028,
+# U+2029), BOM, 서로게이트, 비문자. YAML이 다르게 해석하거나 거부하므로 PyYAML에 맡김
+_FLAT_UNSAFE_CHARS_RE = re.compile(
+    "[^\n\x20-\x7e\xa0-\u2027\u202a-\ud7ff\ue000-\ufefe\uff00-\ufffd"
+    "\U00010000-\U0010ffff]"
+)
+
 
 class SkillMetadata(TypedDict):
     """Agent Skills 명세를 따르는 스킬 메타데이터."""
@@ -71,33 +107,50 @@ class SkillMetadata(TypedDict):
     """사전 승인된 도구의 공백 구분 목록."""
 
 
-def _is_safe_path(path: Path, base_dir: Path) -> bool:
-    """경로가 base_dir 내에 안전하게 포함되어 있는지 확인한다.
+def invalidate_skills_cache() -> None:
+    """스캔 간에 유지되는 스킬 디렉토리 및 메타데이터 캐시를 비운다.
+
+    스킬 파일을 직접 만들거나 지운 뒤 다음 스캔이 반드시 다시 확인하게 할 때 호출한다.
+    """
+    _MISSING_SKILL_MD_CACHE.clear()
+    _METADATA_CACHE.clear()
+
+
+def _is_safe_path(path: str | os.PathLike[str], base_prefix: str) -> bool:
+    """경로가 기본 디렉토리 내에 안전하게 포함되어 있는지 확인한다.
 
     심볼릭 링크나 경로 조작을 통한 디렉토리 탐색 공격을 방지한다.
-    두 경로 모두 정규 형식으로 변환(심볼릭 링크 따라감)하고
-    대상 경로가 기본 디렉토리 내에 있는지 확인한다.
+    경로를 정규 형식으로 변환(심볼릭 링크 따라감)한 뒤 문자열 접두사로 비교하므로
+    Path 객체 생성과 기본 디렉토리의 반복 해석을 피한다.
 
     Args:
         path: 검증할 경로
-        base_dir: 경로가 포함되어야 하는 기본 디렉토리
+        base_prefix: 해석된 기본 디렉토리 경로 (구분자로 끝남)
 
     Returns:
-        경로가 base_dir 내에 안전하게 있으면 True, 그렇지 않으면 False
+        경로가 기본 디렉토리 내에 안전하게 있으면 True, 그렇지 않으면 False
     """
     try:
-        resolved_path = path.resolve()
-        resolved_base = base_dir.resolve()
-        resolved_path.relative_to(resolved_base)
-        return True
-    except ValueError:
-        # 경로가 base_dir의 하위 디렉토리가 아님
-        return False
-    except (OSError, RuntimeError):
-        # 경로 해석 오류 (예: 순환 심볼릭 링크)
+        return os.path.realpath(path).startswith(base_prefix)
+    except (OSError, ValueError):
+        # 경로 해석 오류
         return False
 
 
+def _is_valid_skill_name(name: str) -> bool:
+    """이름이 소문자 영숫자 세그먼트를 단일 하이픈으로 이은 형태인지 확인한다.
+
+    짧은 ASCII 문자열에서는 정규식 엔진보다 문자 집합 검사가 빠르다.
+    """
+    return (
+        bool(name)
+        and _SKILL_NAME_CHARS.issuperset(name)
+        and name[0] != "-"
+        and name[-1] != "-"
+        and "--" not in name
+    )
+
+
 def _validate_skill_name(name: str, directory_name: str) -> tuple[bool, str]:
     """Agent Skills 명세에 따라 스킬 이름을 검증한다.
 
@@ -119,8 +172,7 @@ def _validate_skill_name(name: str, directory_name: str) -> tuple[bool, str]:
         return False, "이름은 필수입니다"
     if len(name) > MAX_SKILL_NAME_LENGTH:
         return False, "이름이 64자를 초과합니다"
-    # 패턴: 소문자 영숫자, 세그먼트 사이에 단일 하이픈
-    if not re.match(r"^[a-z0-9]+(-[a-z0-9]+)*$", name):
+    if not _is_valid_skill_name(name):
         return False, "이름은 소문자 영숫자와 단일 하이픈만 사용해야 합니다"
     if name != directory_name:
         return (
@@ -130,30 +182,121 @@ def _validate_skill_name(name: str, directory_name: str) -> tuple[bool, str]:
     return True, ""
 
 
-def _parse_skill_metadata(skill_md_path: Path, source: str) -> SkillMetadata | None:
+@functools.cache
+def _yaml_loader() -> type:
+    """YAML 로더 클래스를 반환한다 (첫 호출 시 PyYAML을 import).
+
+    평면 프론트매터만 있는 경우 PyYAML import 비용이 들지 않도록 지연 로드한다.
+    libyaml 기반 C 로더가 있으면 순수 Python SafeLoader보다 훨씬 빠르다.
+    """
+    import yaml
+
+    return getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
+
+def _parse_flat_frontmatter(frontmatter_str: str) -> dict[str, str] | None:
+    """평면 `key: value` 형태의 프론트매터를 YAML 파서 없이 파싱한다.
+
+    키와 값이 모두 문자열로 해석되는 단순한 경우만 처리하고, 중첩 구조나
+    YAML이 다른 타입으로 해석하거나 오류로 거부할 수 있는 입력이면 None을
+    반환해 호출자가 YAML 로더로 대체하게 한다.
+
+    Args:
+        frontmatter_str: `---` 구분자 사이의 프론트매터 문자열
+
+    Returns:
+        키-값 딕셔너리, 빠른 경로로 처리할 수 없으면 None
+    """
+    if _FLAT_UNSAFE_CHARS_RE.search(frontmatter_str):
+        return None
+
+    data: dict[str, str] = {}
+    for line in frontmatter_str.split("\n"):
+        if not line.strip(" ") or line[0] == "#":
+            continue
+        key, sep, value = line.partition(":")
+        if not sep or not key or not _FLAT_KEY_CHARS.issuperset(key):
+            return None
+        # 숫자/bool/null로 해석되는 키는 문자열 키가 아님
+        if key[0] in _YAML_SPECIAL_STARTS or key.lower() in _YAML_RESERVED_WORDS:
+            return None
+        if value and value[0] != " ":
+            return None
+        value = value.strip(" ")
+        if not value:
+            return None
+
+        quote = value[0]
+        if quote in "\"'":
+            if len(value) < 2 or value[-1] != quote:
+                return None
+            inner = value[1:-1]
+            if quote == '"':
+                # 이스케이프 시퀀스는 YAML에 맡김
+                if "\\" in inner or '"' in inner:
+                    return None
+            else:
+                if "'" in inner.replace("''", ""):
+                    return None
+                inner = inner.replace("''", "'")
+            data[key] = inner
+            continue
+
+        if (
+            value[0] in _YAML_SPECIAL_STARTS
+            or value[-1] == ":"
+            or value.lower() in _YAML_RESERVED_WORDS
+            or ": " in value
+            or " #" in value
+        ):
+            return None
+        data[key] = value
+
+    return data or None
+
+
+def _parse_skill_metadata(
+    skill_md_path: Path,
+    source: str,
+    stat_result: os.stat_result | None = None,
+) -> SkillMetadata | None:
     """Agent Skills 명세에 따라 SKILL.md 파일에서 YAML 프론트매터를 파싱한다.
 
+    파일 전체가 아니라 프론트매터를 담기에 충분한 앞부분만 읽으며, 그 안에서
+    닫는 구분자를 찾지 못한 경우에만 나머지를 읽는다.
+
     Args:
         skill_md_path: SKILL.md 파일 경로
         source: 스킬 출처 ('user' 또는 'project')
+        stat_result: 호출자가 이미 얻은 SKILL.md의 stat 결과 (있으면 재사용)
 
     Returns:
         모든 필드가 있는 SkillMetadata, 파싱 실패 시 None
     """
     try:
-        # 보안: DoS 방지를 위한 파일 크기 확인
-        file_size = skill_md_path.stat().st_size
-        if file_size > MAX_SKILL_FILE_SIZE:
-            logger.warning(
-                "%s 건너뜀: 파일이 너무 큼 (%d 바이트)", skill_md_path, file_size
-            )
-            return None
-
-        content = skill_md_path.read_text(encoding="utf-8")
-
-        # --- 구분자 사이의 YAML 프론트매터 매칭
-        frontmatter_pattern = r"^---\s*\n(.*?)\n---\s*\n"
-        match = re.match(frontmatter_pattern, content, re.DOTALL)
+        # 한 번의 open으로 크기 확인과 읽기를 함께 처리
+        with open(skill_md_path, encoding="utf-8") as f:
+            # 보안: DoS 방지를 위한 파일 크기 확인
+            if stat_result is None:
+                stat_result = os.fstat(f.fileno())
+            file_size = stat_result.st_size
+            if file_size > MAX_SKILL_FILE_SIZE:
+                logger.warning(
+                    "%s 건너뜀: 파일이 너무 큼 (%d 바이트)", skill_md_path, file_size
+                )
+                return None
+
+            # 프론트매터만 필요하므로 앞부분만 읽고, 닫는 구분자가 없을 때만 나머지를 읽음
+            # (`---`로 시작하지 않으면 프론트매터가 없으므로 더 읽지 않음)
+            content = f.read(_FRONTMATTER_READ_SIZE)
+            match = _FRONTMATTER_RE.match(content)
+            if (
+                match is None
+                and len(content) == _FRONTMATTER_READ_SIZE
+                and content.startswith("---")
+            ):
+                content += f.read(MAX_SKILL_FILE_SIZE - _FRONTMATTER_READ_SIZE)
+                match = _FRONTMATTER_RE.match(content)
 
         if not match:
             logger.warning(
@@ -163,12 +306,19 @@ def _parse_skill_metadata(skill_md_path: Path, source: str) -> SkillMetadata | N
 
         frontmatter_str = match.group(1)
 
-        # 적절한 중첩 구조 지원을 위해 safe_load로 YAML 파싱
-        try:
-            frontmatter_data = yaml.safe_load(frontmatter_str)
-        except yaml.YAMLError as e:
-            logger.warning("%s의 YAML이 유효하지 않음: %s", skill_md_path, e)
-            return None
+        # 평면 key: value 프론트매터는 YAML 파서 없이 처리하고,
+        # 중첩 구조 등은 safe 로더로 YAML 파싱
+        frontmatter_data: dict[str, Any] | None = _parse_flat_frontmatter(
+            frontmatter_str
+        )
+        if frontmatter_data is None:
+            import yaml
+
+            try:
+                frontmatter_data = yaml.load(frontmatter_str, Loader=_yaml_loader())
+            except yaml.YAMLError as e:
+                logger.warning("%s의 YAML이 유효하지 않음: %s", skill_md_path, e)
+                return None
 
         if not isinstance(frontmatter_data, dict):
             logger.warning("%s 건너뜀: 프론트매터가 매핑이 아님", skill_md_path)
@@ -243,41 +393,104 @@ def _list_skills_from_dir(skills_dir: Path, source: str) -> list[SkillMetadata]:
         name, description, path, source가 있는 스킬 메타데이터 딕셔너리 목록
     """
     skills_dir = skills_dir.expanduser()
-    if not skills_dir.exists():
-        return []
 
-    # 보안 검사를 위한 기본 디렉토리 해석
+    # 보안 검사를 위한 기본 디렉토리 해석 (한 번만 수행)
     try:
-        resolved_base = skills_dir.resolve()
+        base_prefix = os.path.join(skills_dir.resolve(), "")
     except (OSError, RuntimeError):
         return []
 
-    skills: list[SkillMetadata] = []
-
-    # 하위 디렉토리 순회
-    for skill_dir in skills_dir.iterdir():
-        # 보안: 스킬 디렉토리 외부를 가리키는 심볼릭 링크 포착
-        if not _is_safe_path(skill_dir, resolved_base):
-            continue
+    # 스캔 순서대로의 결과 자리와, 파싱이 필요한 (결과 위치, 경로, stat) 목록
+    results: list[SkillMetadata | None] = []
+    candidates: list[tuple[int, Path, os.stat_result]] = []
 
-        if not skill_dir.is_dir():
-            continue
+    # 하위 디렉토리 순회: DirEntry가 readdir의 타입 정보를 캐시하므로 추가 stat이 없음
+    try:
+        with os.scandir(skills_dir) as entries:
+            for entry in entries:
+                # 보안: 스킬 디렉토리 외부를 가리키는 심볼릭 링크 포착
+                # (일반 항목은 구성상 skills_dir 내부에 있음)
+                if entry.is_symlink() and not _is_safe_path(entry.path, base_prefix):
+                    continue
+
+                if not entry.is_dir():
+                    continue
+
+                # SKILL.md가 없다고 기록된 디렉토리는 그 뒤로 변경되지 않았으면 건너뜀
+                # (SKILL.md 생성/삭제는 디렉토리 mtime을 바꿈)
+                try:
+                    dir_mtime_ns = entry.stat().st_mtime_ns
+                except OSError:
+                    continue
+                if _MISSING_SKILL_MD_CACHE.get(entry.path) == dir_mtime_ns:
+                    continue
+
+                # SKILL.md 파일 찾기
+                skill_md_path = Path(entry.path, "SKILL.md")
+                try:
+                    skill_md_stat = os.stat(skill_md_path)
+                except FileNotFoundError:
+                    _MISSING_SKILL_MD_CACHE[entry.path] = dir_mtime_ns
+                    continue
+                except OSError:
+                    continue
+
+                # 보안: 읽기 전에 SKILL.md 경로 검증
+                # skill_dir은 이미 검증했으므로 SKILL.md가 심볼릭 링크일 때만 다시 해석
+                if os.path.islink(skill_md_path) and not _is_safe_path(
+                    skill_md_path, base_prefix
+                ):
+                    continue
+
+                # 같은 stat 결과로 일반 파일 여부와 크기를 확인해 불필요한 open을 피함
+                # (FIFO 같은 특수 파일은 open 시 블록될 수 있음)
+                if not stat.S_ISREG(skill_md_stat.st_mode):
+                    continue
+                if skill_md_stat.st_size > MAX_SKILL_FILE_SIZE:
+                    logger.warning(
+                        "%s 건너뜀: 파일이 너무 큼 (%d 바이트)",
+                        skill_md_path,
+                        skill_md_stat.st_size,
+                    )
+                    continue
+
+                # 같은 stat의 SKILL.md는 이전 파싱 결과를 재사용
+                cache_key = (skill_md_stat.st_mtime_ns, skill_md_stat.st_size, source)
+                cached = _METADATA_CACHE.get(str(skill_md_path))
+                if cached is not None and cached[0] == cache_key:
+                    results.append(cached[1])
+                    continue
+
+                candidates.append((len(results), skill_md_path, skill_md_stat))
+                results.append(None)
+    except OSError:
+        # 디렉토리가 없거나 읽을 수 없음
+        return []
 
-        # SKILL.md 파일 찾기
-        skill_md_path = skill_dir / "SKILL.md"
-        if not skill_md_path.exists():
-            continue
+    # 메타데이터 파싱: 스킬이 많으면 파일 읽기를 스레드로 겹침 (I/O 중 GIL 해제)
+    def parse(candidate: tuple[int, Path, os.stat_result]) -> SkillMetadata | None:
+        _, skill_md_path, skill_md_stat = candidate
+        metadata = _parse_skill_metadata(
+            skill_md_path, source=source, stat_result=skill_md_stat
+        )
+        # 파싱 실패(None)도 기록해 파일이 바뀌기 전까지 같은 경고를 반복하지 않음
+        _METADATA_CACHE[str(skill_md_path)] = (
+            (skill_md_stat.st_mtime_ns, skill_md_stat.st_size, source),
+            metadata,
+        )
+        return metadata
 
-        # 보안: 읽기 전에 SKILL.md 경로 검증
-        if not _is_safe_path(skill_md_path, resolved_base):
-            continue
+    if len(candidates) > _PARALLEL_PARSE_THRESHOLD:
+        max_workers = min(_MAX_PARSE_WORKERS, os.cpu_count() or 1)
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            parsed = list(executor.map(parse, candidates))
+    else:
+        parsed = [parse(candidate) for candidate in candidates]
 
-        # 메타데이터 파싱
-        metadata = _parse_skill_metadata(skill_md_path, source=source)
-        if metadata:
-            skills.append(metadata)
+    for (index, _, _), metadata in zip(candidates, parsed):
+        results[index] = metadata
 
-    return skills
+    return [metadata for metadata in results if metadata]
 
 
 def list_skills(
@@ -288,29 +501,37 @@ def list_skills(
     """사용자 및/또는 프로젝트 디렉토리에서 스킬을 나열한다.
 
     두 디렉토리가 모두 제공되면, 사용자 스킬과 동일한 이름의 프로젝트 스킬이
-    사용자 스킬을 오버라이드한다.
+    사용자 스킬을 오버라이드한다. 한 디렉토리 안에서 같은 이름이 여러 번 나오면
+    나중에 발견된 스킬이 남는다.
 
     Args:
         user_skills_dir: 사용자 레벨 스킬 디렉토리 경로
         project_skills_dir: 프로젝트 레벨 스킬 디렉토리 경로
 
     Returns:
-        두 출처의 스킬 메타데이터를 병합한 목록.
+        두 출처의 스킬 메타데이터를 이름 기준으로 병합한 목록.
         이름이 충돌할 때 프로젝트 스킬이 우선됨
     """
-    all_skills: dict[str, SkillMetadata] = {}
-
-    # 사용자 스킬을 먼저 로드 (기본)
-    if user_skills_dir:
+    if user_skills_dir and project_skills_dir:
+        # 두 디렉토리 스캔은 독립적인 I/O이므로 동시에 수행
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            user_future = executor.submit(
+                _list_skills_from_dir, user_skills_dir, "user"
+            )
+            project_future = executor.submit(
+                _list_skills_from_dir, project_skills_dir, "project"
+            )
+            user_skills = user_future.result()
+            project_skills = project_future.result()
+    elif user_skills_dir:
         user_skills = _list_skills_from_dir(user_skills_dir, source="user")
-        for skill in user_skills:
-            all_skills[skill["name"]] = skill
-
-    # 프로젝트 스킬을 두 번째로 로드 (오버라이드/확장)
-    if project_skills_dir:
+        project_skills = []
+    elif project_skills_dir:
+        user_skills = []
         project_skills = _list_skills_from_dir(project_skills_dir, source="project")
-        for skill in project_skills:
-            # 프로젝트 스킬이 같은 이름의 사용자 스킬을 오버라이드
-            all_skills[skill["name"]] = skill
+    else:
+        return []
 
-    return list(all_skills.values())
+    # 이름 기준으로 병합: 나중 것이 우선(프로젝트 > 사용자, 같은 디렉토리 안에서는 나중에 발견된 것)
+    merged = {skill["name"]: skill for skill in (*user_skills, *project_skills)}
+    return list(merged.values())
@@ -19,6 +19,9 @@ research_agent 프로젝트용으로 deepagents-cli에서 적응함.
 
 from __future__ import annotations
 
+import asyncio
+import functools
+import os
 from collections.abc import Awaitable, Callable
 from pathlib import Path
 from typing import Any, NotRequired, TypedDict, cast
@@ -41,6 +44,9 @@ class SkillsState(AgentState):
     skills_metadata: NotRequired[list[SkillMetadata]]
     """로드된 스킬 메타데이터 목록 (이름, 설명, 경로)."""
 
+    skills_section: NotRequired[str]
+    """before_agent에서 미리 렌더링한 시스템 프롬프트용 스킬 섹션."""
+
 
 class SkillsStateUpdate(TypedDict):
     """스킬 미들웨어용 상태 업데이트."""
@@ -48,6 +54,9 @@ class SkillsStateUpdate(TypedDict):
     skills_metadata: list[SkillMetadata]
     """로드된 스킬 메타데이터 목록 (이름, 설명, 경로)."""
 
+    skills_section: str
+    """before_agent에서 미리 렌더링한 시스템 프롬프트용 스킬 섹션."""
+
 
 # 스킬 시스템 문서 템플릿
 SKILLS_SYSTEM_PROMPT = """
@@ -96,6 +105,53 @@ Note: Skills are tools that make you more capable and consistent. When in doubt,
 """
 
 
+@functools.lru_cache(maxsize=128)
+def _resolve_absolute_dir(path: Path) -> Path:
+    """절대 경로의 심볼릭 링크를 해석한다 (같은 경로에 대한 반복 해석을 캐시)."""
+    return path.resolve()
+
+
+def _resolve_skills_dir(path: str | Path) -> Path:
+    """스킬 디렉토리 경로를 `~` 확장 후 절대 경로로 해석한다.
+
+    결과가 현재 작업 디렉토리나 HOME에 따라 달라지지 않는 절대 경로만 캐시하고,
+    상대 경로와 `~` 경로는 매번 해석한다.
+    """
+    path = Path(path)
+    if path.is_absolute():
+        return _resolve_absolute_dir(path)
+    return path.expanduser().resolve()
+
+
+def _skills_dir_signature(
+    skills_dir: Path | None,
+) -> tuple[int, tuple[tuple[str, int, int] | tuple[str, None], ...]] | None:
+    """스킬 디렉토리의 변경 여부를 판단하기 위한 stat 기반 키를 만든다.
+
+    디렉토리 자체의 mtime은 스킬 추가/삭제를, 각 SKILL.md의 (mtime, 크기)는
+    제자리 편집을 반영한다. 디렉토리가 없으면 None을 반환한다.
+    """
+    if skills_dir is None:
+        return None
+    try:
+        dir_mtime = os.stat(skills_dir).st_mtime_ns
+        entries: list[tuple[str, int, int] | tuple[str, None]] = []
+        with os.scandir(skills_dir) as it:
+            for entry in it:
+                if not entry.is_dir():
+                    continue
+                try:
+                    st = os.stat(os.path.join(entry.path, "SKILL.md"))
+                except OSError:
+                    entries.append((entry.name, None))
+                else:
+                    entries.append((entry.name, st.st_mtime_ns, st.st_size))
+    except OSError:
+        return None
+    entries.sort()
+    return dir_mtime, tuple(entries)
+
+
 class SkillsMiddleware(AgentMiddleware):
     """에이전트 스킬을 로드하고 노출하기 위한 미들웨어.
 
@@ -130,23 +186,40 @@ class SkillsMiddleware(AgentMiddleware):
             assistant_id: 에이전트 식별자.
             project_skills_dir: 프로젝트 레벨 스킬 디렉토리 경로 (선택).
         """
-        self.skills_dir = Path(skills_dir).expanduser()
+        self.skills_dir = _resolve_skills_dir(skills_dir)
         self.assistant_id = assistant_id
         self.project_skills_dir = (
-            Path(project_skills_dir).expanduser() if project_skills_dir else None
+            _resolve_skills_dir(project_skills_dir) if project_skills_dir else None
         )
         # 프롬프트 표시용 경로 저장
         self.user_skills_display = f"~/.deepagents/{assistant_id}/skills"
         self.system_prompt_template = SKILLS_SYSTEM_PROMPT
-
-    def _format_skills_locations(self) -> str:
-        """시스템 프롬프트 표시용 스킬 위치를 포맷팅한다."""
+        # 스킬 위치는 생성 후 바뀌지 않으므로 한 번만 포맷팅
         locations = [f"**User Skills**: `{self.user_skills_display}`"]
         if self.project_skills_dir:
             locations.append(
                 f"**Project Skills**: `{self.project_skills_dir}` (overrides user skills)"
             )
-        return "\n".join(locations)
+        self._skills_locations = "\n".join(locations)
+        # 템플릿을 {skills_list} 기준으로 미리 나눠, 호출 시에는 문자열 연결만 수행
+        head, _, tail = self.system_prompt_template.partition("{skills_list}")
+        self._prompt_head = head.replace("{skills_locations}", self._skills_locations)
+        self._prompt_tail = tail
+        # 스킬이 없을 때의 섹션은 경로에만 의존하므로 미리 렌더링
+        self._empty_section = self._prompt_head + self._format_skills_list([]) + tail
+        # 마지막으로 로드한 스킬 목록
+        self._skills_cache: list[SkillMetadata] | None = None
+        # 그 목록을 로드할 때의 (사용자, 프로젝트) 디렉토리 stat 키
+        self._skills_key: tuple[object, object] | None = None
+        # 마지막으로 렌더링한 (스킬 목록, 내용 키, 스킬 섹션)
+        self._section_cache: (
+            tuple[list[SkillMetadata], tuple[tuple[str, str, str, str], ...], str]
+            | None
+        ) = None
+
+    def _format_skills_locations(self) -> str:
+        """시스템 프롬프트 표시용 스킬 위치를 반환한다 (__init__에서 미리 포맷팅됨)."""
+        return self._skills_locations
 
     def _format_skills_list(self, skills: list[SkillMetadata]) -> str:
         """시스템 프롬프트 표시용 스킬 메타데이터를 포맷팅한다."""
@@ -156,29 +229,72 @@ class SkillsMiddleware(AgentMiddleware):
                 locations.append(f"{self.project_skills_dir}/")
             return f"(No skills available. You can create skills in {' or '.join(locations)})"
 
-        # 출처별로 스킬 그룹화
-        user_skills = [s for s in skills if s["source"] == "user"]
-        project_skills = [s for s in skills if s["source"] == "project"]
+        # 출처별로 스킬 그룹화 (한 번의 순회). 표시에 필요한 필드만 튜플로 꺼내 둠
+        user_skills: list[tuple[str, str, str]] = []
+        project_skills: list[tuple[str, str, str]] = []
+        for s in skills:
+            source = s["source"]
+            if source == "user":
+                user_skills.append((s["name"], s["description"], s["path"]))
+            elif source == "project":
+                project_skills.append((s["name"], s["description"], s["path"]))
 
-        lines = []
+        lines: list[str] = []
 
-        # 사용자 스킬 표시
+        # 사용자 스킬 표시 (그룹마다 extend 한 번으로 목록 크기 조정)
         if user_skills:
             lines.append("**User Skills:**")
-            for skill in user_skills:
-                lines.append(f"- **{skill['name']}**: {skill['description']}")
-                lines.append(f"  → To read full instructions: `{skill['path']}`")
+            lines.extend(
+                [
+                    f"- **{name}**: {description}\n"
+                    f"  → To read full instructions: `{path}`"
+                    for name, description, path in user_skills
+                ]
+            )
             lines.append("")
 
         # 프로젝트 스킬 표시
         if project_skills:
             lines.append("**Project Skills:**")
-            for skill in project_skills:
-                lines.append(f"- **{skill['name']}**: {skill['description']}")
-                lines.append(f"  → To read full instructions: `{skill['path']}`")
+            lines.extend(
+                [
+                    f"- **{name}**: {description}\n"
+                    f"  → To read full instructions: `{path}`"
+                    for name, description, path in project_skills
+                ]
+            )
 
         return "\n".join(lines)
 
+    def _get_skills_section(self, skills_metadata: list[SkillMetadata]) -> str:
+        """스킬 메타데이터로 시스템 프롬프트의 스킬 섹션을 렌더링한다.
+
+        스킬 목록은 before_agent에서만 교체되므로, 같은 목록 객체에 대한
+        반복 모델 호출에서는 이전에 렌더링한 섹션을 그대로 재사용한다.
+        목록 객체가 바뀌어도(예: 체크포인트에서 복원된 상태) 내용이 같으면
+        포맷팅을 건너뛴다.
+        """
+        if not skills_metadata:
+            return self._empty_section
+
+        cached = self._section_cache
+        if cached is not None and cached[0] is skills_metadata:
+            return cached[2]
+
+        key = tuple(
+            (s["name"], s["description"], s["path"], s["source"])
+            for s in skills_metadata
+        )
+        if cached is not None and cached[1] == key:
+            skills_section = cached[2]
+        else:
+            # 스킬 목록만 포맷팅해 미리 나눠 둔 템플릿 사이에 끼워 넣기
+            skills_list = self._format_skills_list(skills_metadata)
+            skills_section = self._prompt_head + skills_list + self._prompt_tail
+        # 목록 참조를 함께 보관하므로 id가 다른 객체에 재사용될 일이 없다
+        self._section_cache = (skills_metadata, key, skills_section)
+        return skills_section
+
     def before_agent(
         self, state: AgentState[Any], runtime: Runtime[Any]
     ) -> dict[str, Any] | None:
@@ -192,15 +308,75 @@ class SkillsMiddleware(AgentMiddleware):
             runtime: 런타임 컨텍스트.
 
         Returns:
-            skills_metadata가 채워진 업데이트된 상태.
+            skills_metadata와 렌더링된 skills_section이 채워진 업데이트된 상태.
+            상태에 이미 같은 스킬과 섹션이 있으면 None (상태 업데이트 없음).
         """
         _ = runtime
-        # 디렉토리 변경을 캐치하기 위해 각 상호작용마다 스킬 다시 로드
-        skills = list_skills(
-            user_skills_dir=self.skills_dir,
-            project_skills_dir=self.project_skills_dir,
+        # 디렉토리 변경을 캐치하기 위해 매 상호작용마다 stat 키를 확인하고,
+        # 바뀐 경우에만 스킬을 다시 스캔. 키는 스캔 전에 계산해 스캔 도중의
+        # 변경은 다음 호출에서 다시 감지되도록 함
+        key = (
+            _skills_dir_signature(self.skills_dir),
+            _skills_dir_signature(self.project_skills_dir),
         )
-        return {"skills_metadata": skills}
+        skills = self._skills_cache
+        if skills is None or key != self._skills_key:
+            skills = list_skills(
+                user_skills_dir=self.skills_dir,
+                project_skills_dir=self.project_skills_dir,
+            )
+            self._skills_cache = skills
+            self._skills_key = key
+        # 스킬이 바뀌는 곳은 여기뿐이므로, 모델 호출마다가 아니라 여기서 섹션을 렌더링
+        skills_section = self._get_skills_section(skills)
+
+        # 이전 실행에서 넣어 둔 값이 그대로면 상태 병합 자체를 건너뜀
+        # (체크포인트에서 복원된 상태도 맞도록 동일성이 아닌 값으로 비교)
+        if (
+            state.get("skills_section") == skills_section
+            and state.get("skills_metadata") == skills
+        ):
+            return None
+
+        return {
+            "skills_metadata": skills,
+            "skills_section": skills_section,
+        }
+
+    async def abefore_agent(
+        self, state: AgentState[Any], runtime: Runtime[Any]
+    ) -> dict[str, Any] | None:
+        """(비동기) 에이전트 실행 전에 스킬 메타데이터를 로드한다.
+
+        디렉토리 스캔과 SKILL.md 읽기는 블로킹 파일 I/O이므로 이벤트 루프를
+        막지 않도록 작업 스레드에서 before_agent를 실행한다.
+
+        Args:
+            state: 현재 에이전트 상태.
+            runtime: 런타임 컨텍스트.
+
+        Returns:
+            skills_metadata와 렌더링된 skills_section이 채워진 업데이트된 상태.
+        """
+        return await asyncio.to_thread(self.before_agent, state, runtime)
+
+    def _build_system_prompt(self, request: ModelRequest) -> str:
+        """기존 시스템 프롬프트 뒤에 스킬 섹션을 붙인 시스템 프롬프트를 만든다."""
+        # state_schema로 인해 상태가 SkillsState임이 보장됨
+        # (문자열 타입 인자를 쓰는 cast는 호출마다 제네릭 별칭을 만들지 않음)
+        state = cast("SkillsState", request.state)
+
+        # before_agent에서 렌더링한 섹션 사용, 없으면 스킬 메타데이터로 렌더링
+        skills_section = state.get("skills_section")
+        if skills_section is None:
+            skills_metadata = state.get("skills_metadata", [])
+            skills_section = self._get_skills_section(skills_metadata)
+
+        existing = str(request.system_message.content) if request.system_message else ""
+        if existing:
+            # 긴 시스템 프롬프트의 중간 문자열 생성 없이 한 번에 할당
+            return "".join((existing, "\n\n", skills_section))
+        return skills_section
 
     def wrap_model_call(
         self,
@@ -218,27 +394,7 @@ class SkillsMiddleware(AgentMiddleware):
         Returns:
             핸들러의 모델 응답.
         """
-        # 상태에서 스킬 메타데이터 가져오기
-        skills_metadata = cast(
-            list[SkillMetadata], request.state.get("skills_metadata", [])
-        )
-
-        # 스킬 위치와 목록 포맷팅
-        skills_locations = self._format_skills_locations()
-        skills_list = self._format_skills_list(skills_metadata)
-
-        # 스킬 문서 포맷팅
-        skills_section = self.system_prompt_template.format(
-            skills_locations=skills_locations,
-            skills_list=skills_list,
-        )
-
-        existing = str(request.system_message.content) if request.system_message else ""
-        if existing:
-            system_prompt = existing + "\n\n" + skills_section
-        else:
-            system_prompt = skills_section
-
+        system_prompt = self._build_system_prompt(request)
         return handler(request.override(system_message=SystemMessage(content=system_prompt)))
 
     async def awrap_model_call(
@@ -255,26 +411,7 @@ class SkillsMiddleware(AgentMiddleware):
         Returns:
             핸들러의 모델 응답.
         """
-        # state_schema로 인해 상태가 SkillsState임이 보장됨
-        state = cast("SkillsState", request.state)
-        skills_metadata = cast(list[SkillMetadata], state.get("skills_metadata", []))
-
-        # 스킬 위치와 목록 포맷팅
-        skills_locations = self._format_skills_locations()
-        skills_list = self._format_skills_list(skills_metadata)
-
-        # 스킬 문서 포맷팅
-        skills_section = self.system_prompt_template.format(
-            skills_locations=skills_locations,
-            skills_list=skills_list,
-        )
-
-        existing = str(request.system_message.content) if request.system_message else ""
-        if existing:
-            system_prompt = existing + "\n\n" + skills_section
-        else:
-            system_prompt = skills_section
-
+        system_prompt = self._build_system_prompt(request)
         return await handler(
             request.override(system_message=SystemMessage(content=system_prompt))
         )
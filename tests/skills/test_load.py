@@ -0,0 +1,100 @@
+from pathlib import Path
+
+import pytest
+import yaml
+
+from research_agent.skills.load import _parse_flat_frontmatter, list_skills
+
+
+def _write_skill(skills_dir: Path, dir_name: str, name: str, description: str) -> None:
+    skill_dir = skills_dir / dir_name
+    skill_dir.mkdir(parents=True)
+    (skill_dir / "SKILL.md").write_text(
+        f"---\nname: {name}\ndescription: {description}\n---\n\nContent\n",
+        encoding="utf-8",
+    )
+
+
+class TestListSkills:
+    def test_duplicate_names_in_directory_listed_once(self, tmp_path: Path):
+        user_dir = tmp_path / "user"
+        _write_skill(user_dir, "alpha", "shared-skill", "From alpha")
+        _write_skill(user_dir, "beta", "shared-skill", "From beta")
+
+        skills = list_skills(user_skills_dir=user_dir)
+
+        assert [s["name"] for s in skills] == ["shared-skill"]
+
+    def test_project_overrides_user(self, tmp_path: Path):
+        user_dir = tmp_path / "user"
+        project_dir = tmp_path / "project"
+        _write_skill(user_dir, "shared-skill", "shared-skill", "User version")
+        _write_skill(user_dir, "user-only", "user-only", "User only")
+        _write_skill(project_dir, "shared-skill", "shared-skill", "Project version")
+
+        skills = list_skills(user_skills_dir=user_dir, project_skills_dir=project_dir)
+
+        by_name = {s["name"]: s for s in skills}
+        assert len(skills) == 2
+        assert by_name["shared-skill"]["description"] == "Project version"
+        assert by_name["shared-skill"]["source"] == "project"
+        assert by_name["user-only"]["source"] == "user"
+
+
+# 빠른 경로가 처리해야 하는 평면 프론트매터
+_FLAT_FRONTMATTER = [
+    "name: web-research\ndescription: Research the web",
+    "name: web-research\ndescription: 웹 리서치 스킬",
+    "name: a\ndescription: Uses a:b and x-y, also (parens)",
+    "name: a\n# comment\n\ndescription: b",
+    "name: a  \ndescription:   padded  ",
+    "name: a\ndescription: 'it''s quoted'",
+    'name: a\ndescription: "double # quoted: value"',
+    "name: a\nallowed-tools: Read Write",
+    "name: a\ndescription: Price 100% sure",
+    "name: a\ndescription: ends with hash#",
+    "name: a\ndescription: \u3000ideographic space",
+]
+
+# 빠른 경로 밖의 입력: YAML이 다른 타입으로 해석하거나 오류로 거부하는 경우 포함
+_NON_FLAT_FRONTMATTER = [
+    "name: a\ndescription: Ends with colon:",
+    "name: a\ndescription: ",
+    "name: a\ndescription:",
+    "name: a\ndescription: x\x85y",
+    "name: a\ndescription: x\u2028y",
+    "name: a\ndescription: x\x07y",
+    "name: a\ndescription: x\x7f",
+    "name:\ta",
+    "name: a\ndescription: a: b",
+    "name: a\ndescription: text # comment",
+    "name: a\ndescription: yes",
+    "name: a\ndescription: 12",
+    "name: a\ndescription: ~",
+    "name: a\ndescription: [x, y]",
+    'name: a\ndescription: "x\\ny"',
+    "name: a\ndescription: 'unterminated",
+    "name: a\nmetadata:\n  author: me",
+    "0: a",
+    "true: a",
+    "null: a",
+]
+
+
+class TestParseFlatFrontmatter:
+    @pytest.mark.parametrize("frontmatter", _FLAT_FRONTMATTER)
+    def test_flat_matches_yaml(self, frontmatter: str):
+        parsed = _parse_flat_frontmatter(frontmatter)
+
+        assert parsed is not None
+        assert parsed == yaml.safe_load(frontmatter)
+
+    @pytest.mark.parametrize("frontmatter", _NON_FLAT_FRONTMATTER)
+    def test_non_flat_falls_back_to_yaml(self, frontmatter: str):
+        assert _parse_flat_frontmatter(frontmatter) is None
+
+    def test_ends_with_colon_is_rejected_like_yaml(self, tmp_path: Path):
+        user_dir = tmp_path / "user"
+        _write_skill(user_dir, "colon", "colon", "Ends with colon:")
+
+        assert list_skills(user_skills_dir=user_dir) == []
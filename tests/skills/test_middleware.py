@@ -0,0 +1,133 @@
+from pathlib import Path
+
+import pytest
+
+from research_agent.skills.load import SkillMetadata
+from research_agent.skills.middleware import SKILLS_SYSTEM_PROMPT, SkillsMiddleware
+
+
+def _skill(name: str, source: str) -> SkillMetadata:
+    return {
+        "name": name,
+        "description": f"{name} description",
+        "path": f"/skills/{name}/SKILL.md",
+        "source": source,
+    }
+
+
+class TestSkillsSection:
+    @pytest.mark.parametrize("project_skills_dir", [None, "/project/skills"])
+    @pytest.mark.parametrize(
+        "skills",
+        [
+            [],
+            [_skill("web-research", "user")],
+            [_skill("web-research", "user"), _skill("code-review", "project")],
+        ],
+    )
+    def test_matches_template_format(
+        self, skills: list[SkillMetadata], project_skills_dir: str | None
+    ):
+        middleware = SkillsMiddleware(
+            skills_dir=Path("/user/skills"),
+            assistant_id="agent",
+            project_skills_dir=project_skills_dir,
+        )
+
+        expected = SKILLS_SYSTEM_PROMPT.format(
+            skills_locations=middleware._format_skills_locations(),
+            skills_list=middleware._format_skills_list(skills),
+        )
+
+        assert middleware._get_skills_section(skills) == expected
+
+    def test_reuses_section_for_equal_skills(self):
+        middleware = SkillsMiddleware(skills_dir="/user/skills", assistant_id="agent")
+        skills = [_skill("web-research", "user")]
+
+        first = middleware._get_skills_section(skills)
+
+        assert middleware._get_skills_section(list(skills)) is first
+
+    def test_rerenders_when_skills_change(self):
+        middleware = SkillsMiddleware(skills_dir="/user/skills", assistant_id="agent")
+        skill = _skill("web-research", "user")
+        middleware._get_skills_section([skill])
+
+        changed = {**skill, "description": "updated description"}
+
+        assert "updated description" in middleware._get_skills_section([changed])
+
+
+def _write_skill(skills_dir: Path, name: str, description: str) -> Path:
+    skill_md = skills_dir / name / "SKILL.md"
+    skill_md.parent.mkdir(parents=True, exist_ok=True)
+    skill_md.write_text(f"---\nname: {name}\ndescription: {description}\n---\n")
+    return skill_md
+
+
+class TestBeforeAgent:
+    def test_reuses_skills_when_directory_unchanged(self, tmp_path: Path):
+        _write_skill(tmp_path, "web-research", "Research the web")
+        middleware = SkillsMiddleware(skills_dir=tmp_path, assistant_id="agent")
+
+        first = middleware.before_agent({"messages": []}, None)
+        second = middleware.before_agent({"messages": []}, None)
+
+        assert first is not None and second is not None
+
+        assert second["skills_metadata"] is first["skills_metadata"]
+
+    def test_returns_no_update_when_state_is_current(self, tmp_path: Path):
+        _write_skill(tmp_path, "web-research", "Research the web")
+        middleware = SkillsMiddleware(skills_dir=tmp_path, assistant_id="agent")
+
+        update = middleware.before_agent({"messages": []}, None)
+
+        assert middleware.before_agent({"messages": [], **update}, None) is None
+
+    def test_reloads_when_skill_edited_or_added(self, tmp_path: Path):
+        _write_skill(tmp_path, "web-research", "Research the web")
+        middleware = SkillsMiddleware(skills_dir=tmp_path, assistant_id="agent")
+        middleware.before_agent({"messages": []}, None)
+
+        _write_skill(tmp_path, "web-research", "Research the web in depth")
+        _write_skill(tmp_path, "code-review", "Review code")
+        update = middleware.before_agent({"messages": []}, None)
+
+        assert update is not None
+        descriptions = {s["name"]: s["description"] for s in update["skills_metadata"]}
+        assert descriptions == {
+            "web-research": "Research the web in depth",
+            "code-review": "Review code",
+        }
+
+
+class TestSkillsDirResolution:
+    def test_relative_dir_follows_working_directory(
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ):
+        for name in ("a", "b"):
+            (tmp_path / name / "skills").mkdir(parents=True)
+
+        monkeypatch.chdir(tmp_path / "a")
+        first = SkillsMiddleware(skills_dir="skills", assistant_id="agent")
+        monkeypatch.chdir(tmp_path / "b")
+        second = SkillsMiddleware(skills_dir="skills", assistant_id="agent")
+
+        assert first.skills_dir == (tmp_path / "a" / "skills").resolve()
+        assert second.skills_dir == (tmp_path / "b" / "skills").resolve()
+
+    def test_home_dir_follows_home(
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ):
+        for name in ("a", "b"):
+            (tmp_path / name / "skills").mkdir(parents=True)
+
+        monkeypatch.setenv("HOME", str(tmp_path / "a"))
+        first = SkillsMiddleware(skills_dir="~/skills", assistant_id="agent")
+        monkeypatch.setenv("HOME", str(tmp_path / "b"))
+        second = SkillsMiddleware(skills_dir="~/skills", assistant_id="agent")
+
+        assert first.skills_dir == (tmp_path / "a" / "skills").resolve()
+        assert second.skills_dir == (tmp_path / "b" / "skills").resolve()